@@ -55,6 +55,14 @@ DATABASES = {
     }
 }
 
+# Cache (registrations, etc.). Point CACHE_LOCATION at Redis in multi-process deployments.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "libtrack-default"),
+    }
+}
+
 AUTH_PASSWORD_VALIDATORS = []
 
 LANGUAGE_CODE = "en-us"
@@ -6,11 +6,16 @@ class StackComponentInline(admin.TabularInline):
     extra = 0
     fields = ("category", "name", "version", "scope")
 
+    def get_queryset(self, request):
+        # Inline rows are labelled with __str__, which reads the project
+        return super().get_queryset(request).select_related("project")
+
 
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ("project_name", "developer_names", "notification_type", "updated_at")
     search_fields = ("project_name", "developer_names", "developer_emails")
+    ordering = ("project_name",)
     inlines = [StackComponentInline]
 
 
@@ -19,6 +24,8 @@ class UpdateCacheAdmin(admin.ModelAdmin):
     list_display = ("library","version","category","release_date","updated_at")
     search_fields = ("library","version")
     list_filter = ("category",)
+    ordering = ("-updated_at",)
+    list_select_related = ("project",)
     # readonly_fields = ("updated_at",)
 
     # def save_model(self, request, obj, form, change):
@@ -43,6 +50,7 @@ class FutureUpdateCacheAdmin(admin.ModelAdmin):
     list_display = ("library", "version", "confidence", "status", "expected_date", "notification_sent", "updated_at")
     search_fields = ("library", "version", "features")
     list_filter = ("status", "notification_sent", "confidence")
+    ordering = ("-confidence", "-updated_at")
     readonly_fields = ("created_at", "updated_at", "notification_sent_at")
     fieldsets = (
         ("Update Information", {
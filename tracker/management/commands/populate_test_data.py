@@ -72,7 +72,7 @@ class Command(BaseCommand):
                 'category': 'major',
                 'summary': 'Major release with breaking changes and performance improvements',
                 'source': 'https://numpy.org/releases/2.0.0',
-                'release_date': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+                'release_date': (datetime.now() - timedelta(days=30)).date()
             },
             {
                 'library': 'pandas',
@@ -80,7 +80,7 @@ class Command(BaseCommand):
                 'category': 'minor',
                 'summary': 'Minor release with bug fixes and new features',
                 'source': 'https://pandas.pydata.org/releases/2.1.0',
-                'release_date': (datetime.now() - timedelta(days=15)).strftime('%Y-%m-%d')
+                'release_date': (datetime.now() - timedelta(days=15)).date()
             },
             {
                 'library': 'requests',
@@ -88,7 +88,7 @@ class Command(BaseCommand):
                 'category': 'minor',
                 'summary': 'Security updates and bug fixes',
                 'source': 'https://requests.readthedocs.io/releases/2.31.0',
-                'release_date': (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+                'release_date': (datetime.now() - timedelta(days=7)).date()
             }
         ]
 
@@ -1,11 +1,14 @@
 import os
+import re
 import time
 import logging
-import schedule
-from time import sleep
+from collections import defaultdict
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from django.db import transaction
+from django.db.models import Prefetch, Q
+from django.utils import timezone
 from dotenv import load_dotenv, find_dotenv
 from packaging import version as pkg_version
 from packaging.version import InvalidVersion
@@ -13,8 +16,19 @@ from django.core.management.base import BaseCommand, CommandError
 
 from tracker.utils.serper_fetcher import SerperFetcher
 from tracker.utils.groq_analyzer import GroqAnalyzer
-from tracker.utils.send_mail import send_update_email
-from tracker.models import UpdateCache, Project, FutureUpdateCache, Library, LibraryRelease, StackComponent
+from tracker.utils.send_mail import send_update_email_batch
+from tracker.utils.http_session import build_http_session
+from tracker.utils.csv_fields import split_csv
+from tracker.utils.dates import parse_release_date
+from tracker.models import (
+    UpdateCache,
+    Project,
+    FutureUpdateCache,
+    Library,
+    LibraryRelease,
+    StackComponent,
+    SchedulerState,
+)
 
 # Get logger
 logger = logging.getLogger('libtrack')
@@ -31,15 +45,59 @@ else:
 load_dotenv()
 
 DEFAULT_AUTO_RUN_TIME = "09:00"
+_TIME_RE = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$")
+
+# Libraries checked more recently than this are skipped (no Serper/Groq calls).
+# Kept below 24h so the regular daily run always re-checks.
+RECHECK_INTERVAL = timedelta(hours=float(os.getenv("LIBRARY_RECHECK_HOURS", "12")))
+
+# Future updates below this confidence (%) are not announced.
+MIN_CONFIDENCE = 70
+# A known future update is re-announced when its confidence rises by at least this much.
+MIN_CONFIDENCE_INCREASE = 15
+
+
+def should_notify_confidence(confidence: int) -> bool:
+    """True when a future update is confident enough to announce."""
+    return confidence >= MIN_CONFIDENCE
+
+
+@lru_cache(maxsize=2048)
+def _parse_version(value: str):
+    """Memoized pkg_version.parse; the same version strings recur across projects."""
+    return pkg_version.parse(value)
+
 
 class Command(BaseCommand):
     help = "Runs daily update check using Serper.dev + Groq and emails relevant updates via Mailtrap"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Names whose Serper/Groq lookup failed this run; they are retried on the next run
+        self._failed_lookups: set[str] = set()
+        # Credentials and API clients, set up once per process by _setup()
+        self.mailtrap_key: str | None = None
+        self.sender_email: str | None = None
+        self.session = None
+        self.groq: GroqAnalyzer | None = None
+        self.serper: SerperFetcher | None = None
+
     def add_arguments(self, parser):
         parser.add_argument(
             "--auto",
             action="store_true",
-            help=f"Run in auto-schedule mode (defaults to daily at {DEFAULT_AUTO_RUN_TIME}).",
+            help=(
+                f"Run in auto-schedule mode (defaults to daily at {DEFAULT_AUTO_RUN_TIME}). "
+                "Prefer a cron entry without --auto; this keeps the process alive between runs."
+            ),
+        )
+        parser.add_argument(
+            "--skip-recent",
+            action="store_true",
+            help=(
+                "Skip libraries successfully checked within LIBRARY_RECHECK_HOURS, "
+                "for manual re-runs. Catch-up runs in --auto mode always skip them."
+            ),
         )
         parser.add_argument(
             "--time",
@@ -54,85 +112,160 @@ class Command(BaseCommand):
         if run_time and not self._is_valid_time_format(run_time):
             raise CommandError("Invalid value for --time. Use HH:MM in 24-hour format, e.g. 09:00.")
 
-        if options.get("auto"):
-            self.stdout.write(
-                self.style.MIGRATE_HEADING(f"⏰ Auto mode: will run every day at {run_time}")
-            )
-            schedule.every().day.at(run_time).do(self.run_daily_check)
-            while True:
-                schedule.run_pending()
-                time.sleep(30)
-        else:
-            self.run_daily_check()
+        # Fail fast, before any scheduling or Serper/Groq work
+        if not self._setup():
+            return
 
-    def run_daily_check(self):
-        self.stdout.write(self.style.NOTICE("LibTrack AI: Daily check starting..."))
+        try:
+            if options.get("auto"):
+                self.stdout.write(
+                    self.style.MIGRATE_HEADING(f"⏰ Auto mode: will run every day at {run_time}")
+                )
+                # Catch up if the process was down when today's run was due
+                if self._missed_todays_run(run_time, SchedulerState.get().last_run_at):
+                    self.stdout.write(self.style.WARNING(f"Missed today's {run_time} run; running now."))
+                    self.run_daily_check(skip_recent=True)
+
+                # Sleep precisely until the next run instead of polling every 30s
+                while True:
+                    time.sleep(self._seconds_until(run_time))
+                    self.run_daily_check()
+            else:
+                self.run_daily_check(skip_recent=options.get("skip_recent", False))
+        finally:
+            self.session.close()
 
-        mailtrap_key = os.getenv("MAILTRAP_API_KEY")
-        sender_email = os.getenv("MAILTRAP_FROM_EMAIL")
+    def _setup(self) -> bool:
+        """
+        Read Mailtrap credentials and build the API clients once per process.
+        The pooled HTTP session is shared by every Serper/Mailtrap call across runs.
+        """
+        if self.session is not None:
+            return True
 
-        if not mailtrap_key or not sender_email:
+        self.mailtrap_key = os.getenv("MAILTRAP_API_KEY")
+        self.sender_email = os.getenv("MAILTRAP_FROM_EMAIL")
+        if not self.mailtrap_key or not self.sender_email:
             self.stdout.write(self.style.ERROR("❌ Missing Mailtrap credentials."))
+            return False
+
+        self.session = build_http_session()
+        self.groq = GroqAnalyzer()
+        self.serper = SerperFetcher(session=self.session)
+        return True
+
+    def run_daily_check(self, skip_recent: bool = False):
+        """
+        Run one full check. With `skip_recent`, libraries successfully checked within
+        RECHECK_INTERVAL are left out; the scheduled daily run always checks everything.
+        """
+        self.stdout.write(self.style.NOTICE("LibTrack AI: Daily check starting..."))
+
+        if not self._setup():
+            return
+
+        self._failed_lookups.clear()
+
+        if not StackComponent.objects.exists():
+            self.stdout.write("No registered stack components; nothing to check.")
+            SchedulerState.record_run()
             return
 
         # 1. SYNC: Map all components to central `Library` entities
         self.stdout.write(self.style.MIGRATE_HEADING("1. Syncing Libraries..."))
         self._sync_libraries()
-        
+
         # 2. FETCH: Update each unique Library (Only 1 API call per lib!)
         self.stdout.write(self.style.MIGRATE_HEADING("2. Fetching Updates for Libraries..."))
-        self._update_libraries()
-        
+        self._update_libraries(skip_recent=skip_recent)
+
         # 3. NOTIFY: Check projects against the updated Library data
         self.stdout.write(self.style.MIGRATE_HEADING("3. Notifying Projects..."))
-        self._notify_projects(mailtrap_key, sender_email)
+        self._notify_projects()
 
+        SchedulerState.record_run()
         self.stdout.write(self.style.SUCCESS("✅ Daily check completed successfully."))
 
     def _sync_libraries(self):
         """
         Iterate over all StackComponents that are not linked to a Library.
         Create/Find the Library and link it.
+
+        Libraries are resolved in bulk: one query for existing rows, one
+        bulk_create for the missing ones and one bulk_update for the links.
         """
-        components = StackComponent.objects.filter(library_ref__isnull=True)
-        count = components.count()
-        self.stdout.write(f"Found {count} unlinked components.")
-        
+        components = list(StackComponent.objects.filter(library_ref__isnull=True))
+        self.stdout.write(f"Found {len(components)} unlinked components.")
+        if not components:
+            return
+
+        # Normalize key and determine type once per component
+        wanted: dict[str, dict] = {}
+        component_keys = []
         for comp in components:
-            # Normalize key
             raw_name = comp.name.strip()
             key = raw_name.lower().replace(" ", "-") # Simplified normalization
-            
-            # Determine type
-            ctype = "library"
-            if comp.key == "language":
-                ctype = "language"
-            
-            library, created = Library.objects.get_or_create(
-                key=key,
-                defaults={
-                    "name": raw_name,
-                    "component_type": ctype
-                }
-            )
-            
+            ctype = "language" if comp.key == "language" else "library"
+            wanted.setdefault(key, {"name": raw_name, "component_type": ctype})
+            component_keys.append(key)
+
+        library_map: dict[str, Library] = {}
+        for library in Library.objects.filter(key__in=wanted.keys()).order_by("id"):
+            library_map.setdefault(library.key, library)
+
+        missing = [
+            Library(key=key, **defaults)
+            for key, defaults in wanted.items()
+            if key not in library_map
+        ]
+        if missing:
+            Library.objects.bulk_create(missing, ignore_conflicts=True)
+            # Re-read so we get primary keys (and rows another writer created concurrently)
+            for library in Library.objects.filter(key__in=[lib.key for lib in missing]).order_by("id"):
+                if library.key not in library_map:
+                    library_map[library.key] = library
+                    self.stdout.write(f"[NEW] Created Library: {library.name}")
+
+        linked = []
+        for comp, key in zip(components, component_keys):
+            library = library_map.get(key)
+            if library is None:
+                self.stdout.write(self.style.WARNING(f"⚠️  Could not resolve Library for {comp.name}"))
+                continue
             comp.library_ref = library
-            comp.save()
-            if created:
-                self.stdout.write(f"[NEW] Created Library: {library.name}")
+            linked.append(comp)
+
+        StackComponent.objects.bulk_update(linked, ["library_ref"])
     
-    def _update_libraries(self):
+    def _update_libraries(self, skip_recent: bool = False):
         """
         Fetch updates for all Libraries.
         """
-        groq = GroqAnalyzer()
-        serper = SerperFetcher()
+        groq = self.groq
+        serper = self.serper
         
         # Only check libraries that are actually used (linked to at least one component)
         # to avoid checking libraries that were deleted from all projects.
-        libraries = Library.objects.filter(linked_components__isnull=False).distinct()
-        self.stdout.write(f"Checking {libraries.count()} unique libraries...")
+        used_libraries = Library.objects.filter(linked_components__isnull=False).distinct()
+        if skip_recent:
+            # Manual re-runs and restarts skip libraries that were checked successfully just before
+            checked_before = timezone.now() - RECHECK_INTERVAL
+            libraries = list(
+                used_libraries.filter(Q(last_checked_at__isnull=True) | Q(last_checked_at__lt=checked_before))
+            )
+            skipped = used_libraries.count() - len(libraries)
+            if skipped:
+                self.stdout.write(f"Skipping {skipped} libraries checked within the last {RECHECK_INTERVAL}.")
+        else:
+            libraries = list(used_libraries)
+        self.stdout.write(f"Checking {len(libraries)} unique libraries...")
+
+        # One batched Serper round-trip for every library instead of one per query
+        prefetched = serper.search_libraries_batch(
+            [(library.name, library.latest_version, library.component_type) for library in libraries]
+        )
 
+        checked_at = timezone.now()
         for library in libraries:
             self.stdout.write(f"   Checking {library.name} (current: v{library.latest_version or 'unknown'})...")
             
@@ -146,7 +279,8 @@ class Command(BaseCommand):
                 serper=serper,
                 notify_pref="all", # Get everything
                 component_type=library.component_type,
-                is_library_check=True 
+                is_library_check=True,
+                serper_results=prefetched.get(library.name),
             )
             
             # Debug logging to see what Groq returned
@@ -166,8 +300,8 @@ class Command(BaseCommand):
                             should_update = True
                             skip_reason = "no previous version"
                         else:
-                            parsed_new = pkg_version.parse(detected_version)
-                            parsed_current = pkg_version.parse(library.latest_version)
+                            parsed_new = _parse_version(detected_version)
+                            parsed_current = _parse_version(library.latest_version)
                             
                             if parsed_new > parsed_current:
                                 should_update = True
@@ -178,31 +312,16 @@ class Command(BaseCommand):
                         
                         if should_update:
                             library.latest_version = detected_version
-                            library.last_checked_at = datetime.now()
-                            library.save()
                             
                             # Extract summary and source from updates
                             summary_text = updates.get("summary", "")
                             source_url = updates.get("source", "")
                             release_date_str = updates.get("release_date", "")
                             
-                            # Parse the release date from Groq (format: YYYY-MM-DD or text like "Not Confirmed")
-                            parsed_release_date = None
-                            if release_date_str:
-                                try:
-                                    # Try to parse as YYYY-MM-DD
-                                    from datetime import datetime as dt
-                                    parsed_release_date = dt.strptime(release_date_str, "%Y-%m-%d").date()
-                                except (ValueError, TypeError):
-                                    # If parsing fails, try other common formats or leave as None
-                                    try:
-                                        # Try MM/DD/YYYY
-                                        parsed_release_date = dt.strptime(release_date_str, "%m/%d/%Y").date()
-                                    except (ValueError, TypeError):
-                                        # If still fails, use today as fallback only if it looks like a valid recent date
-                                        # Otherwise leave as None to avoid showing incorrect dates
-                                        self.stdout.write(f"[WARN] Could not parse release_date: {release_date_str}")
-                                        parsed_release_date = None
+                            # Same formats as the dashboard and UpdateCache; placeholders like "Not Confirmed" give None
+                            parsed_release_date = parse_release_date(release_date_str)
+                            if parsed_release_date is None and release_date_str:
+                                self.stdout.write(f"[WARN] Could not parse release_date: {release_date_str}")
                             
                             # Fallback to today's date only if no date was provided at all
                             if parsed_release_date is None:
@@ -214,24 +333,26 @@ class Command(BaseCommand):
                             self.stdout.write(f"- Source: {source_url}" if source_url else f"- Source: EMPTY")
                             self.stdout.write(f"- Release Date: {parsed_release_date} (from Groq: '{release_date_str}')")
                             
-                            # Save history
-                            release, created = LibraryRelease.objects.get_or_create(
-                                library=library,
-                                version=detected_version,
-                                defaults={
-                                    "release_date": parsed_release_date,
-                                    "summary": summary_text,
-                                    "source_url": source_url,
-                                    "is_security_release": False
-                                }
-                            )
+                            # Save the library and its release history together in one transaction
+                            with transaction.atomic():
+                                library.save()
+                                release, created = LibraryRelease.objects.get_or_create(
+                                    library=library,
+                                    version=detected_version,
+                                    defaults={
+                                        "release_date": parsed_release_date,
+                                        "summary": summary_text,
+                                        "source_url": source_url,
+                                        "is_security_release": False
+                                    }
+                                )
                             
-                            if not created:
-                                # Update existing release with new data
-                                release.summary = summary_text
-                                release.source_url = source_url
-                                release.release_date = parsed_release_date
-                                release.save()
+                                if not created:
+                                    # Update existing release with new data
+                                    release.summary = summary_text
+                                    release.source_url = source_url
+                                    release.release_date = parsed_release_date
+                                    release.save()
                             
                             self.stdout.write(self.style.SUCCESS(f"✅ Updated to v{detected_version}"))
                         else:
@@ -241,18 +362,32 @@ class Command(BaseCommand):
                         self.stdout.write(self.style.WARNING(f"⚠️  Version comparison failed: {e}"))
             else:
                 self.stdout.write(f"ℹ️  No update detected by Groq")
-            
-            sleep(1.5) # Rate limiting
 
-    def _notify_projects(self, mailtrap_key, sender_email):
+        # Record the check only where Serper and Groq answered; failed lookups are retried next run
+        checked = [library.pk for library in libraries if library.name not in self._failed_lookups]
+        Library.objects.filter(pk__in=checked).update(last_checked_at=checked_at)
+
+    def _notify_projects(self):
         """
         Fan-out notifications to projects.
         """
-        projects = Project.objects.prefetch_related("components__library_ref").all()
+        # Only load the columns the comparison loop reads
+        components = StackComponent.objects.select_related("library_ref").only(
+            "project", "name", "version", "library_ref__name", "library_ref__latest_version"
+        )
+        projects = Project.objects.only("project_name", "developer_emails").prefetch_related(
+            Prefetch("components", queryset=components)
+        )
+        if not projects.exists():
+            self.stdout.write("No projects registered; nothing to notify.")
+            return
+
+        per_recipient: dict[str, list[tuple[str, list[dict]]]] = defaultdict(list)
         
-        for project in projects:
+        # Stream projects (and their prefetched components) in chunks to keep memory flat
+        for project in projects.iterator(chunk_size=100):
             project_name = project.project_name
-            emails = [e.strip() for e in (project.developer_emails or "").split(",") if e.strip()]
+            emails = split_csv(project.developer_emails)
             if not emails:
                 continue
                 
@@ -270,7 +405,7 @@ class Command(BaseCommand):
                     continue
                 
                 try:
-                    if pkg_version.parse(lib.latest_version) > pkg_version.parse(comp.version):
+                    if _parse_version(lib.latest_version) > _parse_version(comp.version):
                         # Use the LibraryRelease metadata if available
                         release = lib.releases.filter(version=lib.latest_version).first()
                         
@@ -299,31 +434,66 @@ class Command(BaseCommand):
                     continue
 
             if updates_to_send:
-                self.stdout.write(self.style.SUCCESS(f"Sending {len(updates_to_send)} updates to {project_name}"))
-                
-                # Re-use existing email function
-                # Note: We need to adapt the payload to what send_update_email expects
-                # We aggregate everything
-                
-                category = "mix"
-                subject_library = updates_to_send[0]["library"]
-                subject_version = updates_to_send[0]["version"]
-                if len(updates_to_send) > 1:
-                     subject_library += f" + {len(updates_to_send)-1} others"
-                
-                send_update_email(
-                    mailtrap_api_key=mailtrap_key,
-                    project_name=project_name,
-                    recipients=emails,
-                    library=subject_library,
-                    version=subject_version,
-                    category=category,
-                    summary="Updates detected in your stack.",
-                    source="",
-                    release_date="",
-                    updates=updates_to_send,
-                    from_email=sender_email
-                )
+                self.stdout.write(self.style.SUCCESS(f"Queued {len(updates_to_send)} updates for {project_name}"))
+                # Group by recipient so a developer on several projects gets one digest
+                for email in emails:
+                    per_recipient[email].append((project_name, updates_to_send))
+
+        self._send_digests(self._recipient_jobs(per_recipient))
+
+    def _recipient_jobs(self, per_recipient: dict[str, list[tuple[str, list[dict]]]]) -> list[dict]:
+        """
+        Build one digest message per recipient, merging their projects' updates.
+        """
+        jobs = []
+        for email, items in per_recipient.items():
+            project_names = list(dict.fromkeys(project_name for project_name, _ in items))
+            # The same release can be due in several of the recipient's projects; list it once
+            updates = list({
+                (update["library"], update["version"]): update
+                for _, project_updates in items
+                for update in project_updates
+            }.values())
+
+            # Re-use existing email function
+            # Note: We need to adapt the payload to what send_update_email expects
+            # We aggregate everything
+            
+            category = "mix"
+            subject_library = updates[0]["library"]
+            subject_version = updates[0]["version"]
+            if len(updates) > 1:
+                 subject_library += f" + {len(updates)-1} others"
+            
+            jobs.append(dict(
+                project_name=", ".join(project_names),
+                recipients=[email],
+                library=subject_library,
+                version=subject_version,
+                category=category,
+                summary="Updates detected in your stack.",
+                source="",
+                release_date="",
+                updates=updates,
+            ))
+        return jobs
+
+    def _send_digests(self, jobs: list[dict]):
+        """
+        Send the per-recipient digests through Mailtrap's Batch API over the shared session,
+        one request per MAILTRAP_BATCH_LIMIT digests.
+        """
+        if not jobs:
+            return
+
+        ok, status = send_update_email_batch(
+            self.mailtrap_key,
+            jobs,
+            from_email=self.sender_email,
+            session=self.session,
+        )
+        if not ok:
+            self.stdout.write(self.style.WARNING(f"[NOTIFY] Digest batch for {len(jobs)} recipients failed: {status}"))
 
     def _process_components(self, *args, **kwargs):
          # DEPRECATED - Kept empty to satisfy structure if called elsewhere, but we don't use it.
@@ -340,9 +510,19 @@ class Command(BaseCommand):
         notify_pref: str,
         component_type: str,
         is_library_check: bool = False,
+        serper_results: dict | None = None,
     ) -> dict | None:
-        """Run Serper+Groq for a single component and return an update dict if we should email."""
-        serper_results = serper.search_library(name, current_version, component_type=component_type)
+        """
+        Run Serper+Groq for a single component and return an update dict if we should email.
+        Pass `serper_results` when they were already fetched via `search_libraries_batch`.
+        """
+        if serper_results is None:
+            serper_results = serper.search_library(name, current_version, component_type=component_type)
+        
+        if serper_results.get("error"):
+            self.stdout.write(self.style.WARNING(f"[{name}] Serper error: {serper_results['error']}"))
+            self._failed_lookups.add(name)
+            return None
         
         # Log Serper's version candidate for debugging
         candidate = serper_results.get("latest_version_candidate", "")
@@ -358,6 +538,7 @@ class Command(BaseCommand):
         
         if analysis.get("error"):
             self.stdout.write(self.style.WARNING(f"[{name}] Groq error: {analysis['error']}"))
+            self._failed_lookups.add(name)
             return None
 
         library = analysis.get("library", name)
@@ -400,6 +581,8 @@ class Command(BaseCommand):
                  "is_released": is_released
              }
 
+        # Project-level check: no caller holds a transaction here, so lock the cache row
+        # for the read-compare-write below.
         with transaction.atomic():
             cache, _ = UpdateCache.objects.select_for_update().get_or_create(
                 project=project,
@@ -407,7 +590,7 @@ class Command(BaseCommand):
                 defaults={
                     "version": version or "",
                     "category": category,
-                    "release_date": release_date or "",
+                    "release_date": parse_release_date(release_date),
                     "summary": summary or "",
                     "source": source or "",
                 },
@@ -427,9 +610,9 @@ class Command(BaseCommand):
 
             if version and current_version:
                 try:
-                    parsed_new = pkg_version.parse(version)
-                    parsed_current = pkg_version.parse(current_version)
-                    
+                    parsed_new = _parse_version(version)
+                    parsed_current = _parse_version(current_version)
+                
                     if parsed_new <= parsed_current:
                         logger.info(
                             f"[{label}] Skipped - version {version} not newer than current {current_version} "
@@ -452,7 +635,7 @@ class Command(BaseCommand):
             if should_send:
                 cache.version = version or cache.version
                 cache.category = category
-                cache.release_date = release_date or cache.release_date
+                cache.release_date = parse_release_date(release_date) or cache.release_date
                 cache.summary = summary or cache.summary
                 cache.source = source or cache.source
                 cache.save()
@@ -490,8 +673,7 @@ class Command(BaseCommand):
             return None
         
         # ===== Confidence threshold - only send high confidence future updates =====
-        MIN_CONFIDENCE = 70  # Configurable threshold
-        if confidence < MIN_CONFIDENCE:
+        if not should_notify_confidence(confidence):
             self.stdout.write(
                 f"[{label}] Future update confidence too low ({confidence}% < {MIN_CONFIDENCE}%). "
                 f"Version {version}, source: {source[:50] if source else 'N/A'}"
@@ -611,9 +793,7 @@ class Command(BaseCommand):
                     self.stdout.write(f"[{label}] Updated existing future update entry with new info.")
                     
                     # ==== CONFIDENCE INCREASE NOTIFICATION ====
-                    # Threshold for re-notification: 15% increase or more
-                    MIN_CONFIDENCE_INCREASE = 15
-                    
+                    # Threshold for re-notification: MIN_CONFIDENCE_INCREASE or more
                     if confidence_increased and confidence_difference >= MIN_CONFIDENCE_INCREASE:
                         self.stdout.write(
                             self.style.SUCCESS(
@@ -669,11 +849,35 @@ class Command(BaseCommand):
                     "confidence": confidence,
             }
 
+    @staticmethod
+    def _seconds_until(run_time: str, now: datetime | None = None) -> float:
+        """
+        Seconds from `now` until the next occurrence of HH:MM local time (today or tomorrow).
+        Aware datetimes with the same tzinfo subtract as wall-clock times, so compare
+        timestamps instead; otherwise the run drifts by an hour across DST changes.
+        """
+        now = now or timezone.localtime()
+        hour, minute = (int(part) for part in run_time.split(":"))
+        for days in (0, 1):
+            day = now.date() + timedelta(days=days)
+            next_run = datetime(day.year, day.month, day.day, hour, minute, tzinfo=now.tzinfo)
+            if now.tzinfo is None:
+                seconds = (next_run - now).total_seconds()
+            else:
+                seconds = next_run.timestamp() - now.timestamp()
+            if seconds > 0:
+                return seconds
+        return seconds
+
+    @staticmethod
+    def _missed_todays_run(run_time: str, last_run_at: datetime | None, now: datetime | None = None) -> bool:
+        """True if today's HH:MM slot has passed and no run was recorded since."""
+        now = now or timezone.localtime()
+        hour, minute = (int(part) for part in run_time.split(":"))
+        todays_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        return now >= todays_run and (last_run_at is None or last_run_at < todays_run)
+
     @staticmethod
     def _is_valid_time_format(value: str) -> bool:
         """Return True if time is HH:MM in 24h format."""
-        try:
-            time.strptime(value, "%H:%M")
-            return True
-        except (TypeError, ValueError):
-            return False
+        return bool(_TIME_RE.match(value)) if isinstance(value, str) else False
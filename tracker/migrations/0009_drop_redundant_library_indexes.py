@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0008_schedulerstate'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='updatecache',
+            name='library',
+            field=models.CharField(max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='futureupdatecache',
+            name='library',
+            field=models.CharField(max_length=200),
+        ),
+    ]
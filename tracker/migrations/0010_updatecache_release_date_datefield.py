@@ -0,0 +1,75 @@
+# Generated by Django 5.2.7 on 2026-10-16 10:00
+
+from datetime import datetime
+
+from django.db import migrations, models
+
+
+# Frozen copy of tracker.utils.dates as of this migration; later changes to the helper
+# must not change what this historical migration does
+RELEASE_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d %b %Y",
+    "%d %B %Y",
+)
+
+
+def parse_release_date(value):
+    text = (value or "").strip()
+    if not text:
+        return None
+    for fmt in RELEASE_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
+
+
+def forwards(apps, schema_editor):
+    UpdateCache = apps.get_model('tracker', 'UpdateCache')
+    for cache in UpdateCache.objects.exclude(release_date='').only('pk', 'release_date').iterator():
+        parsed = parse_release_date(cache.release_date)
+        if parsed is None:
+            # Placeholders such as "Q1 2025" or "Not Confirmed" have no date
+            continue
+        UpdateCache.objects.filter(pk=cache.pk).update(release_date_new=parsed)
+
+
+def backwards(apps, schema_editor):
+    UpdateCache = apps.get_model('tracker', 'UpdateCache')
+    for cache in UpdateCache.objects.exclude(release_date_new=None).only('pk', 'release_date_new').iterator():
+        UpdateCache.objects.filter(pk=cache.pk).update(release_date=cache.release_date_new.isoformat())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0009_drop_redundant_library_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='updatecache',
+            name='release_date_new',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.RunPython(forwards, backwards),
+        migrations.RemoveField(
+            model_name='updatecache',
+            name='release_date',
+        ),
+        migrations.RenameField(
+            model_name='updatecache',
+            old_name='release_date_new',
+            new_name='release_date',
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-16 10:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker', '0010_updatecache_release_date_datefield'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='project',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='updatecache',
+            options={'verbose_name': 'Update Cache', 'verbose_name_plural': 'Update Caches'},
+        ),
+        migrations.AlterModelOptions(
+            name='futureupdatecache',
+            options={'verbose_name': 'Future Update', 'verbose_name_plural': 'Future Updates'},
+        ),
+    ]
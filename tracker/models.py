@@ -1,6 +1,11 @@
+from functools import cached_property
+
 from django.db import models
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from tracker.utils.csv_fields import split_csv
+
 UPDATE_CATEGORY_CHOICES = [
     ("major", "major"),
     ("minor", "minor"),
@@ -22,12 +27,19 @@ class Project(TimeStampedModel):
     developer_emails = models.TextField()
     notification_type = models.CharField(max_length=100, default="major, minor")
 
-    class Meta:
-        ordering = ["project_name"]
-
     def __str__(self):
         return self.project_name
 
+    @cached_property
+    def notification_prefs(self) -> frozenset:
+        """Lower-cased notification types from notification_type, parsed once per instance."""
+        return frozenset(item.lower() for item in split_csv(self.notification_type))
+
+    def save(self, *args, **kwargs):
+        # notification_type may have been reassigned since the prefs were parsed
+        self.__dict__.pop("notification_prefs", None)
+        super().save(*args, **kwargs)
+
 
 class Library(TimeStampedModel):
     """
@@ -52,6 +64,26 @@ class Library(TimeStampedModel):
         return f"{self.name} (v{self.latest_version})"
 
 
+class SchedulerState(TimeStampedModel):
+    """
+    Singleton row holding scheduler bookkeeping so a restarted --auto process
+    can tell whether today's run was missed.
+    """
+    last_run_at = models.DateTimeField(null=True, blank=True)
+
+    @classmethod
+    def get(cls) -> "SchedulerState":
+        state, _ = cls.objects.get_or_create(pk=1)
+        return state
+
+    @classmethod
+    def record_run(cls, when=None):
+        cls.objects.update_or_create(pk=1, defaults={"last_run_at": when or timezone.now()})
+
+    def __str__(self):
+        return f"Scheduler (last run: {self.last_run_at or 'never'})"
+
+
 class LibraryRelease(TimeStampedModel):
     """
     History of released versions for a specific Library.
@@ -98,16 +130,17 @@ class UpdateCache(TimeStampedModel):
         related_name='update_caches',
         help_text="Project this update cache belongs to"
     )
-    library = models.CharField(max_length=200, db_index=True)
+    # Covered by the (project, library) unique index; no separate index needed
+    library = models.CharField(max_length=200)
     version = models.CharField(max_length=100)
-    release_date = models.CharField(max_length=50, blank=True)
+    # Unparseable/placeholder dates ("Q1 2025", "Not Confirmed") are stored as NULL
+    release_date = models.DateField(null=True, blank=True)
     category = models.CharField(max_length=10, choices=UPDATE_CATEGORY_CHOICES)
     summary = models.TextField(blank=True)
     source = models.URLField(blank=True)
     
     class Meta:
         unique_together = [['project', 'library']]
-        ordering = ['-updated_at']
         verbose_name = 'Update Cache'
         verbose_name_plural = 'Update Caches'
 
@@ -119,7 +152,8 @@ class UpdateCache(TimeStampedModel):
 class FutureUpdateCache(TimeStampedModel):
     """Stores detected future/planned updates separately from released versions."""
     
-    library = models.CharField(max_length=200, db_index=True)
+    # Leading column of the (library, version) unique index
+    library = models.CharField(max_length=200)
     version = models.CharField(max_length=100)
     expected_date = models.DateField(null=True, blank=True, help_text="Expected release date if known")
     confidence = models.IntegerField(
@@ -166,7 +200,6 @@ class FutureUpdateCache(TimeStampedModel):
     )
     
     class Meta:
-        ordering = ['-confidence', '-updated_at']
         unique_together = [['library', 'version']]
         verbose_name = 'Future Update'
         verbose_name_plural = 'Future Updates'
@@ -2,31 +2,42 @@ import os
 import requests
 from dotenv import load_dotenv
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 
 
 # ✅ Find .env manually
 BASE_DIR = Path(__file__).resolve().parent.parent
 env_path = BASE_DIR / ".env"
-print("Loading env from:", env_path)
 
 load_dotenv(dotenv_path=env_path)
 
-API_KEY = os.getenv("SERPER_API_KEY")
-print("Loaded SERPER_API_KEY:", API_KEY)
-
-if not API_KEY:
-    raise RuntimeError("SERPER_API_KEY is missing")
-
-url = "https://google.serper.dev/search"
-headers = {
-    "X-API-KEY": API_KEY,
-    "Content-Type": "application/json",
-}
-payload = {
-    "q": "LibTrack AI project by Raghav",
-    "num": 5,
-}
-
-resp = requests.post(url, json=payload, headers=headers)
-print("Status:", resp.status_code)
-print("Body:", resp.text[:500])  # print first 500 chars
+SERPER_URL = "https://google.serper.dev/search"
+
+# Pooled session reused across calls; nothing is sent at import time.
+# Built here rather than via tracker.utils so the script still runs standalone.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+
+def search_serper(query: str, num: int = 5):
+    """POST a single query to Serper and return the response."""
+    api_key = os.getenv("SERPER_API_KEY")
+    if not api_key:
+        raise RuntimeError("SERPER_API_KEY is missing")
+
+    headers = {
+        "X-API-KEY": api_key,
+        "Content-Type": "application/json",
+    }
+    payload = {
+        "q": query,
+        "num": num,
+    }
+    return _SESSION.post(SERPER_URL, json=payload, headers=headers, timeout=(3.05, 10))
+
+
+if __name__ == "__main__":
+    print("Loading env from:", env_path)
+    resp = search_serper("LibTrack AI project by Raghav")
+    print("Status:", resp.status_code)
+    print("Body:", resp.text[:500])  # print first 500 chars
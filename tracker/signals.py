@@ -0,0 +1,33 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from tracker.models import Project, StackComponent
+
+# Serialized project registrations shown on the dashboard
+REGISTRATIONS_CACHE_KEY = "registrations:v1"
+REGISTRATIONS_CACHE_TIMEOUT = 600  # seconds
+
+
+def invalidate_registrations_cache():
+    """Drop cached registrations once the current transaction commits."""
+    transaction.on_commit(lambda: cache.delete(REGISTRATIONS_CACHE_KEY))
+
+
+def bulk_create_components(components, **kwargs):
+    """
+    StackComponent.objects.bulk_create that also invalidates the registrations cache.
+    bulk_create never sends post_save, so use this instead of calling it directly.
+    """
+    created = StackComponent.objects.bulk_create(components, **kwargs)
+    invalidate_registrations_cache()
+    return created
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=StackComponent)
+@receiver(post_delete, sender=StackComponent)
+def _registrations_changed(sender, **kwargs):
+    invalidate_registrations_cache()
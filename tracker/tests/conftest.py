@@ -1,10 +1,60 @@
 """
 Pytest configuration and shared fixtures for LibTrack AI tests.
 """
+import copy
 import pytest
-from unittest.mock import MagicMock, patch
+from functools import partial
+from types import SimpleNamespace
 from datetime import datetime, timedelta
-from django.contrib.auth.models import User
+
+# send_update_email only reads status_code and text, so a plain namespace stands in for the response
+_MAILTRAP_OK = SimpleNamespace(status_code=200, text="Email sent successfully")
+
+# Sample dates are fixed when the test session starts, all from one clock reading
+_SESSION_NOW = datetime.now()
+_TODAY_STR = _SESSION_NOW.strftime("%Y-%m-%d")
+_TODAY_PLUS_90 = (_SESSION_NOW + timedelta(days=90)).date()
+
+# Field values for mock_project unless a test overrides them
+_DEFAULT_PROJECT = {
+    "project_name": "Test Project",
+    "developer_names": "Test Developer",
+    "developer_emails": "test@example.com",
+    "notification_type": "major, minor, future",
+}
+
+# Key order of a mock Groq analysis; every value is overridden per call
+_BASE_ANALYSIS = dict.fromkeys(
+    ("library", "version", "category", "is_released", "confidence",
+     "release_date", "expected_date", "summary", "source"),
+    "",
+)
+
+# Serper "organic" results; {name}, {lower} and {version} are filled in per call
+_SERPER_FUTURE_RESULTS = (
+    {
+        "title": "{name} {version} Roadmap - Planned Release",
+        "link": "https://{lower}.org/roadmap",
+        "snippet": "Planned release of {name} {version} with new features. Expected Q1 2024."
+    },
+    {
+        "title": "{name} Future Plans",
+        "link": "https://github.com/{lower}/issues/123",
+        "snippet": "Version {version} is in development with breaking changes."
+    },
+)
+_SERPER_RELEASED_RESULTS = (
+    {
+        "title": "{name} {version} Released",
+        "link": "https://{lower}.org/releases/{version}",
+        "snippet": "{name} {version} has been officially released with bug fixes and improvements."
+    },
+    {
+        "title": "What's new in {name} {version}",
+        "link": "https://{lower}.org/whatsnew",
+        "snippet": "Major updates in version {version} including performance improvements."
+    },
+)
 
 
 @pytest.fixture
@@ -15,23 +65,10 @@ def db_setup(db):
 
 @pytest.fixture
 def mock_project(db):
-    """Factory fixture for creating test projects."""
+    """Factory fixture for creating test projects; keyword arguments override the defaults."""
     from tracker.models import Project
     
-    def _create_project(
-        project_name="Test Project",
-        developer_names="Test Developer",
-        developer_emails="test@example.com",
-        notification_type="major, minor, future"
-    ):
-        return Project.objects.create(
-            project_name=project_name,
-            developer_names=developer_names,
-            developer_emails=developer_emails,
-            notification_type=notification_type
-        )
-    
-    return _create_project
+    return partial(Project.objects.create, **_DEFAULT_PROJECT)
 
 
 @pytest.fixture
@@ -59,46 +96,19 @@ def mock_stack_component(db):
     return _create_component
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_serper_response():
     """Returns a function to generate mock Serper API responses."""
     
     def _generate_response(library_name, version, is_future=False, confidence=85):
-        if is_future:
-            return {
-                "organic": [
-                    {
-                        "title": f"{library_name} {version} Roadmap - Planned Release",
-                        "link": f"https://{library_name.lower()}.org/roadmap",
-                        "snippet": f"Planned release of {library_name} {version} with new features. Expected Q1 2024."
-                    },
-                    {
-                        "title": f"{library_name} Future Plans",
-                        "link": f"https://github.com/{library_name.lower()}/issues/123",
-                        "snippet": f"Version {version} is in development with breaking changes."
-                    }
-                ]
-            }
-        else:
-            return {
-                "organic": [
-                    {
-                        "title": f"{library_name} {version} Released",
-                        "link": f"https://{library_name.lower()}.org/releases/{version}",
-                        "snippet": f"{library_name} {version} has been officially released with bug fixes and improvements."
-                    },
-                    {
-                        "title": f"What's new in {library_name} {version}",
-                        "link": f"https://{library_name.lower()}.org/whatsnew",
-                        "snippet": f"Major updates in version {version} including performance improvements."
-                    }
-                ]
-            }
+        template = _SERPER_FUTURE_RESULTS if is_future else _SERPER_RELEASED_RESULTS
+        ctx = {"name": library_name, "lower": library_name.lower(), "version": version}
+        return {"organic": [{key: value.format_map(ctx) for key, value in item.items()} for item in template]}
     
     return _generate_response
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_groq_analysis():
     """Returns a function to generate mock Groq analyzer responses."""
     
@@ -110,37 +120,66 @@ def mock_groq_analysis():
         confidence=85,
         expected_date=None
     ):
-        base_analysis = {
-            "library": library_name,
-            "version": version,
-            "category": category,
-            "is_released": is_released,
-            "confidence": confidence,
-            "release_date": datetime.now().strftime("%Y-%m-%d") if is_released else "",
-            "expected_date": expected_date or "",
-            "summary": f"{'Upcoming' if not is_released else 'Released'} version {version} with improvements.",
-            "source": f"https://{library_name.lower()}.org/releases"
-        }
-        
-        return base_analysis
+        return dict(
+            _BASE_ANALYSIS,
+            library=library_name,
+            version=version,
+            category=category,
+            is_released=is_released,
+            confidence=confidence,
+            release_date=_TODAY_STR if is_released else "",
+            expected_date=expected_date or "",
+            summary=f"{'Upcoming' if not is_released else 'Released'} version {version} with improvements.",
+            source=f"https://{library_name.lower()}.org/releases",
+        )
     
     return _generate_analysis
 
 
+@pytest.fixture(scope="session", params=[True, False], ids=["future", "released"])
+def serper_response_variant(request, mock_serper_response):
+    """Serper response for pandas 3.0.0, built once per variant; dependent tests run for both."""
+    return mock_serper_response("pandas", "3.0.0", is_future=request.param)
+
+
+@pytest.fixture(scope="session", params=[True, False], ids=["future", "released"])
+def groq_analysis_variant(request, mock_groq_analysis):
+    """Groq analysis for pandas 3.0.0, built once per variant; dependent tests run for both."""
+    is_future = request.param
+    return mock_groq_analysis(
+        "pandas",
+        "3.0.0",
+        category="future" if is_future else "major",
+        is_released=not is_future,
+    )
+
+
 @pytest.fixture
 def mock_mailtrap_success():
     """Mock successful Mailtrap email sending."""
-    with patch('tracker.utils.send_mail.requests.post') as mock_post:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "Email sent successfully"
-        mock_post.return_value = mock_response
+    from unittest.mock import patch
+
+    with patch('tracker.utils.send_mail.requests.post', return_value=copy.copy(_MAILTRAP_OK)) as mock_post:
         yield mock_post
 
 
+@pytest.fixture
+def mock_email_send():
+    """Stub send_update_email_batch in the daily check so digests are recorded but never rendered."""
+    from unittest.mock import patch
+
+    with patch(
+        'tracker.management.commands.run_daily_check.send_update_email_batch',
+        return_value=(True, "Email stubbed in tests"),
+    ) as mock_send:
+        yield mock_send
+
+
 @pytest.fixture
 def test_user(db):
     """Create a test user for authentication tests."""
+    from django.contrib.auth.models import User
+
     return User.objects.create_user(
         username='testuser',
         email='testuser@example.com',
@@ -148,28 +187,28 @@ def test_user(db):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def future_update_data():
-    """Provides sample data for future update scenarios."""
+    """Provides sample data for future update scenarios (shared; copy before mutating)."""
     return {
         "library": "pandas",
         "version": "3.0.0",
         "confidence": 85,
-        "expected_date": (datetime.now() + timedelta(days=90)).date(),
+        "expected_date": _TODAY_PLUS_90,
         "features": "Major rewrite with improved performance and new data types.",
         "source": "https://pandas.pydata.org/roadmap",
         "status": "detected"
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def released_update_data():
-    """Provides sample data for released update scenarios."""
+    """Provides sample data for released update scenarios (shared; copy before mutating)."""
     return {
         "library": "numpy",
         "version": "2.0.0",
         "category": "major",
-        "release_date": datetime.now().strftime("%Y-%m-%d"),
+        "release_date": _TODAY_STR,
         "summary": "Major release with breaking changes and performance improvements.",
         "source": "https://numpy.org/releases/2.0.0"
     }
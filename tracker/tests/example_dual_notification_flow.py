@@ -10,34 +10,35 @@ Run with: python tracker/tests/example_dual_notification_flow.py
 """
 import os
 import sys
-import django
 from datetime import datetime, timedelta
 
-# Setup Django
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'libtrack_ai.settings')
-django.setup()
+# Console separators
+_RULE = "=" * 80
+_DASHES = "-" * 80
+_LIGHT_RULE = "─" * 80
 
-from tracker.models import Project, StackComponent, UpdateCache, FutureUpdateCache
-from tracker.utils.send_mail import send_update_email
+
+def setup_django():
+    """Bootstrap Django when run as a script; importing this module stays cheap."""
+    import django
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'libtrack_ai.settings')
+    django.setup()
 
 
 def print_header(text):
     """Print formatted header."""
-    print("\n" + "="*80)
-    print(f"  {text}")
-    print("="*80 + "\n")
+    print("\n".join(("\n" + _RULE, f"  {text}", _RULE + "\n")))
 
 
 def print_email_preview(email_type, subject, content_points):
     """Print email preview."""
-    print(f"\n📧 {email_type}")
-    print("-" * 80)
-    print(f"Subject: {subject}")
-    print(f"\nContent includes:")
-    for point in content_points:
-        print(f"  • {point}")
-    print("-" * 80)
+    # Assemble the whole preview and write it in one call
+    lines = [f"\n📧 {email_type}", _DASHES, f"Subject: {subject}", "\nContent includes:"]
+    lines.extend(f"  • {point}" for point in content_points)
+    lines.append(_DASHES)
+    print("\n".join(lines))
 
 
 def example_dual_notification_flow():
@@ -48,6 +49,12 @@ def example_dual_notification_flow():
     - Day 1: Future update detected → Email 1 sent
     - Day 45: Version actually released → Email 2 sent
     """
+    from django.db import DEFAULT_DB_ALIAS, transaction
+    from tracker.models import Project, StackComponent, UpdateCache, FutureUpdateCache
+    from tracker.utils.send_mail import send_update_email
+    
+    # Every date in the scenario is an offset from this single anchor
+    now = datetime.now()
     
     print_header("Dual Notification Flow Example")
     
@@ -61,46 +68,51 @@ def example_dual_notification_flow():
     print_header("CLEANUP")
     print("Removing old test data...")
     
-    # Delete existing pandas 3.0.0 entries if they exist
-    deleted_future = FutureUpdateCache.objects.filter(
-        library='pandas', 
-        version='3.0.0'
-    ).delete()
-    
-    deleted_released = UpdateCache.objects.filter(
-        library='pandas', 
-        version='3.0.0'
-    ).delete()
-    
-    # Delete old test projects
-    deleted_projects = Project.objects.filter(
-        project_name__in=['Data Analytics Platform', 'Demo AI Platform']
-    ).delete()
-    
-    print(f"✓ Cleaned up: {deleted_future[0]} future updates, "
-          f"{deleted_released[0]} releases, {deleted_projects[0]} projects")
+    # One transaction for the whole cleanup. Nothing references FutureUpdateCache, so it
+    # can skip the delete collector; UpdateCache and Project keep it for their
+    # SET_NULL/CASCADE relations and the registrations-cache signals.
+    with transaction.atomic():
+        deleted_future = FutureUpdateCache.objects.filter(
+            library='pandas', 
+            version='3.0.0'
+        )._raw_delete(using=DEFAULT_DB_ALIAS)
+        
+        deleted_released, _ = UpdateCache.objects.filter(
+            library='pandas', 
+            version='3.0.0'
+        ).delete()
+        
+        # Delete old test projects
+        deleted_projects, _ = Project.objects.filter(
+            project_name__in=['Data Analytics Platform', 'Demo AI Platform']
+        ).delete()
+    
+    print(f"✓ Cleaned up: {deleted_future} future updates, "
+          f"{deleted_released} releases, {deleted_projects} projects")
     
     # ========================================================================
     # SETUP: Create project and component
     # ========================================================================
     print_header("SETUP")
     
-    project = Project.objects.create(
-        project_name='Data Analytics Platform',
-        developer_names='Alice Johnson',
-        developer_emails='alice@company.com',
-        notification_type='major, minor, future'  # ← Important: future enabled!
-    )
-    print(f"✓ Created project: {project.project_name}")
-    
-    component = StackComponent.objects.create(
-        project=project,
-        category='library',
-        key='library',
-        name='pandas',
-        version='2.0.0',
-        scope=''
-    )
+    # Project and its component commit together
+    with transaction.atomic():
+        project = Project.objects.create(
+            project_name='Data Analytics Platform',
+            developer_names='Alice Johnson',
+            developer_emails='alice@company.com',
+            notification_type='major, minor, future'  # ← Important: future enabled!
+        )
+        print(f"✓ Created project: {project.project_name}")
+    
+        component = StackComponent.objects.create(
+            project=project,
+            category='library',
+            key='library',
+            name='pandas',
+            version='2.0.0',
+            scope=''
+        )
     print(f"✓ Current version in project: {component.name} {component.version}")
     
     
@@ -115,7 +127,7 @@ def example_dual_notification_flow():
         library='pandas',
         version='3.0.0',
         confidence=92,
-        expected_date=(datetime.now() + timedelta(days=45)).date(),
+        expected_date=(now + timedelta(days=45)).date(),
         features='Major rewrite with improved performance, new nullable integer dtype, '
                  'better memory efficiency, and native string arrays',
         source='https://pandas.pydata.org/roadmap/',
@@ -134,9 +146,9 @@ def example_dual_notification_flow():
     # ========================================================================
     # EMAIL 1: FUTURE UPDATE NOTIFICATION
     # ========================================================================
-    print("\n" + "─" * 80)
+    print("\n" + _LIGHT_RULE)
     print("SENDING EMAIL 1: Future Update Alert")
-    print("─" * 80)
+    print(_LIGHT_RULE)
     
     email1_updates = [{
         'library': 'pandas',
@@ -165,7 +177,7 @@ def example_dual_notification_flow():
     
     # Mark as notified
     future_update.notification_sent = True
-    future_update.notification_sent_at = datetime.now()
+    future_update.notification_sent_at = now
     future_update.save()
     
     print(f"✓ Email sent: {success1}")
@@ -199,7 +211,7 @@ def example_dual_notification_flow():
         library='pandas',
         version='3.0.0',
         category='major',
-        release_date=datetime.now().strftime("%Y-%m-%d"),
+        release_date=now.strftime("%Y-%m-%d"),
         summary='pandas 3.0.0 has been officially released with major performance improvements, '
                 'new nullable integer dtype, better memory management, and native string arrays.',
         source='https://pandas.pydata.org/docs/whatsnew/v3.0.0.html'
@@ -225,9 +237,9 @@ def example_dual_notification_flow():
     # ========================================================================
     # EMAIL 2: ACTUAL RELEASE NOTIFICATION
     # ========================================================================
-    print("\n" + "─" * 80)
+    print("\n" + _LIGHT_RULE)
     print("SENDING EMAIL 2: Release Notification")
-    print("─" * 80)
+    print(_LIGHT_RULE)
     
     email2_updates = [{
         'library': 'pandas',
@@ -316,9 +328,11 @@ def show_email_comparison():
     """Show side-by-side comparison of both emails."""
     print_header("EMAIL COMPARISON")
     
-    print("=" * 80)
-    print(f"{'EMAIL 1: FUTURE UPDATE' : ^40} | {'EMAIL 2: ACTUAL RELEASE' : ^40}")
-    print("=" * 80)
+    lines = [
+        _RULE,
+        f"{'EMAIL 1: FUTURE UPDATE' : ^40} | {'EMAIL 2: ACTUAL RELEASE' : ^40}",
+        _RULE,
+    ]
     
     comparisons = [
         ("Subject", "🔮 Future Update Alert: pandas 3.0.0 Planned", "pandas 3.0.0 Released"),
@@ -331,10 +345,9 @@ def show_email_comparison():
         ("Call to action", "Start planning migration", "Proceed with upgrade"),
     ]
     
-    for label, email1, email2 in comparisons:
-        print(f"{label:15} | {email1:38} | {email2:38}")
-    
-    print("=" * 80)
+    lines.extend(f"{label:15} | {email1:38} | {email2:38}" for label, email1, email2 in comparisons)
+    lines.append(_RULE)
+    print("\n".join(lines))
 
 
 if __name__ == '__main__':
@@ -349,12 +362,14 @@ if __name__ == '__main__':
     ╚════════════════════════════════════════════════════════════════════════════╝
     """)
     
+    setup_django()
+    
     # Run the main example
     result = example_dual_notification_flow()
     
     # Show email comparison
     show_email_comparison()
     
-    print("\n" + "="*80)
+    print("\n" + _RULE)
     print("  To see the actual HTML emails, check your test output or mailtrap inbox")
-    print("="*80 + "\n")
+    print(_RULE + "\n")
@@ -13,102 +13,200 @@ Or in Django shell:
     create_release_scenario()
 """
 import os
+import sys
 import django
 
 # Setup Django environment for standalone execution
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'libtrack_ai.settings')
 django.setup()
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from django.db import transaction
 from tracker.models import Project, StackComponent, UpdateCache, FutureUpdateCache
+from tracker.signals import bulk_create_components
+from tracker.tests.test_fixtures import FIXTURE_BATCH_SIZE, count_rows
 from tracker.utils.send_mail import send_update_email
 
+# Parallel sends when flushing the demo scenarios' queued emails
+MAIL_WORKERS = int(os.getenv("MAIL_WORKERS", "8"))
 
-def create_future_update_scenario():
+# Scenario progress output; set LIBTRACK_FIXTURE_VERBOSE=0 to silence it
+VERBOSE = os.getenv('LIBTRACK_FIXTURE_VERBOSE', '1') == '1'
+
+
+def _log(*lines):
+    """Write progress lines with a single stdout call, unless VERBOSE is off."""
+    if VERBOSE:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _get_or_create_project(project_name, **fields):
+    """Reuse the scenario project left by an earlier run instead of inserting a duplicate."""
+    return Project.objects.get_or_create(project_name=project_name, defaults=fields)
+
+
+# Notifications queued by scenarios built with defer_email=True
+_pending_emails = []
+
+
+def _deliver_email(defer, **email_kwargs):
+    """Send one scenario notification now, or queue it and return None."""
+    if defer:
+        _pending_emails.append(email_kwargs)
+        _log("Email Status: queued")
+        return None
+    success, message = send_update_email(**email_kwargs)
+    _log(
+        f"Email Status: {'✓ Success' if success else '✗ Failed'}",
+        f"Message: {message[:200]}",
+    )
+    return success, message
+
+
+def flush_emails():
+    """
+    Send every queued notification, one email per project and audience.
+    
+    Set LIBTRACK_SKIP_EMAIL=1 to drop the queue without sending.
+    
+    Returns:
+        dict mapping project name to (success, message)
+    """
+    queued = _pending_emails[:]
+    _pending_emails.clear()
+    if os.getenv('LIBTRACK_SKIP_EMAIL') == '1':
+        return {}
+    
+    # Merge queued updates that target the same inbox with the same kind of notice
+    groups = {}
+    for email_kwargs in queued:
+        key = (
+            email_kwargs['mailtrap_api_key'],
+            email_kwargs['project_name'],
+            email_kwargs['recipients'],
+            email_kwargs['future_opt_in'],
+        )
+        if key in groups:
+            groups[key]['updates'] = groups[key]['updates'] + email_kwargs['updates']
+        else:
+            groups[key] = dict(email_kwargs)
+    
+    # Sends are network-bound and independent, so they overlap; inserts stay serial for SQLite
+    jobs = list(groups.values())
+    if not jobs:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAIL_WORKERS, len(jobs))) as ex:
+        outcomes = list(ex.map(lambda job: send_update_email(**job), jobs))
+    
+    results = {}
+    lines = []
+    for email_kwargs, (success, message) in zip(jobs, outcomes):
+        lines.append(f"Email to {email_kwargs['project_name']}: {'✓ Success' if success else '✗ Failed'}")
+        results[email_kwargs['project_name']] = (success, message)
+    _log(*lines)
+    return results
+
+
+def create_future_update_scenario(defer_email=False):
     """
     Create a complete scenario for testing future update detection.
     
+    Args:
+        defer_email: Queue the notification for flush_emails() instead of sending it now
+    
     Returns:
         dict with created objects
     """
-    print("\n" + "="*60)
-    print("SCENARIO 1: Future Update Detection")
-    print("="*60)
-    
-    # Create project with future notifications enabled
-    project = Project.objects.create(
-        project_name='AI Research Platform',
-        developer_names='Alice Johnson, Bob Smith',
-        developer_emails='alice@example.com, bob@example.com',
-        notification_type='major, minor, future'
+    _log(
+        "\n" + "="*60,
+        "SCENARIO 1: Future Update Detection",
+        "="*60,
     )
-    print(f"✓ Created project: {project.project_name}")
-    
-    # Add components
-    components = [
-        StackComponent.objects.create(
-            project=project,
-            category='library',
-            key='library',
-            name='numpy',
-            version='1.24.0',
-            scope=''
-        ),
-        StackComponent.objects.create(
-            project=project,
-            category='library',
-            key='library',
-            name='pandas',
-            version='2.0.3',
-            scope=''
-        ),
-        StackComponent.objects.create(
-            project=project,
-            category='language',
-            key='language',
-            name='Python',
-            version='3.11',
-            scope=''
-        )
-    ]
-    print(f"✓ Created {len(components)} stack components")
-    
-    # Create future updates
-    future_updates = [
-        FutureUpdateCache.objects.create(
-            library='numpy',
-            version='2.0.0',
-            confidence=95,
-            expected_date=(datetime.now() + timedelta(days=60)).date(),
-            features='Complete rewrite with improved performance, new data types, and modern API design',
-            source='https://numpy.org/neps/roadmap.html',
-            status='confirmed'
-        ),
-        FutureUpdateCache.objects.create(
-            library='pandas',
-            version='3.0.0',
-            confidence=85,
-            expected_date=(datetime.now() + timedelta(days=90)).date(),
-            features='Major architectural changes for better memory efficiency and native string dtype',
-            source='https://pandas.pydata.org/roadmap',
-            status='detected'
-        ),
-        FutureUpdateCache.objects.create(
-            library='Python',
-            version='3.13',
-            confidence=100,
-            expected_date=(datetime.now() + timedelta(days=120)).date(),
-            features='JIT compiler, improved error messages, and performance optimizations',
-            source='https://peps.python.org/pep-0719/',
-            status='confirmed'
+    
+    now = datetime.now()
+    
+    # All scenario rows commit together; the email is sent after the commit
+    with transaction.atomic():
+        # Create project with future notifications enabled
+        project, created = _get_or_create_project(
+            project_name='AI Research Platform',
+            developer_names='Alice Johnson, Bob Smith',
+            developer_emails='alice@example.com, bob@example.com',
+            notification_type='major, minor, future'
         )
-    ]
-    print(f"✓ Created {len(future_updates)} future update entries")
+        _log(f"✓ {'Created' if created else 'Reusing'} project: {project.project_name}")
+    
+        # Add components
+        if created:
+            components = bulk_create_components([
+                StackComponent(
+                    project=project,
+                    category='library',
+                    key='library',
+                    name='numpy',
+                    version='1.24.0',
+                    scope=''
+                ),
+                StackComponent(
+                    project=project,
+                    category='library',
+                    key='library',
+                    name='pandas',
+                    version='2.0.3',
+                    scope=''
+                ),
+                StackComponent(
+                    project=project,
+                    category='language',
+                    key='language',
+                    name='Python',
+                    version='3.11',
+                    scope=''
+                )
+            ], batch_size=FIXTURE_BATCH_SIZE)
+        else:
+            components = list(project.components.all())
+        _log(f"✓ Created {len(components)} stack components")
+    
+        # Create future updates
+        future_updates = FutureUpdateCache.objects.bulk_create([
+            FutureUpdateCache(
+                library='numpy',
+                version='2.0.0',
+                confidence=95,
+                expected_date=(now + timedelta(days=60)).date(),
+                features='Complete rewrite with improved performance, new data types, and modern API design',
+                source='https://numpy.org/neps/roadmap.html',
+                status='confirmed'
+            ),
+            FutureUpdateCache(
+                library='pandas',
+                version='3.0.0',
+                confidence=85,
+                expected_date=(now + timedelta(days=90)).date(),
+                features='Major architectural changes for better memory efficiency and native string dtype',
+                source='https://pandas.pydata.org/roadmap',
+                status='detected'
+            ),
+            FutureUpdateCache(
+                library='Python',
+                version='3.13',
+                confidence=100,
+                expected_date=(now + timedelta(days=120)).date(),
+                features='JIT compiler, improved error messages, and performance optimizations',
+                source='https://peps.python.org/pep-0719/',
+                status='confirmed'
+            )
+        ], batch_size=FIXTURE_BATCH_SIZE, ignore_conflicts=True)
+        _log(f"✓ Created {len(future_updates)} future update entries")
     
     # Test email notification for future update
-    print("\n" + "-"*60)
-    print("Testing Future Update Email Notification")
-    print("-"*60)
+    _log(
+        "\n" + "-"*60,
+        "Testing Future Update Email Notification",
+        "-"*60,
+    )
     
     email_updates = [
         {
@@ -135,7 +233,8 @@ def create_future_update_scenario():
         }
     ]
     
-    success, message = send_update_email(
+    email_status = _deliver_email(
+        defer_email,
         mailtrap_api_key=os.getenv('MAILTRAP_MAIN_KEY'),
         project_name=project.project_name,
         recipients=project.developer_emails,
@@ -148,85 +247,96 @@ def create_future_update_scenario():
         future_opt_in=True
     )
     
-    print(f"Email Status: {'✓ Success' if success else '✗ Failed'}")
-    print(f"Message: {message[:200]}")
-    
     return {
         'project': project,
         'components': components,
         'future_updates': future_updates,
-        'email_status': (success, message)
+        'email_status': email_status
     }
 
 
-def create_release_scenario():
+def create_release_scenario(defer_email=False):
     """
     Create a complete scenario for testing actual release notifications.
     
+    Args:
+        defer_email: Queue the notification for flush_emails() instead of sending it now
+    
     Returns:
         dict with created objects
     """
-    print("\n" + "="*60)
-    print("SCENARIO 2: Actual Version Release")
-    print("="*60)
-    
-    # Create project
-    project = Project.objects.create(
-        project_name='E-Commerce Backend',
-        developer_names='Carol Davis, David Wilson',
-        developer_emails='carol@example.com, david@example.com',
-        notification_type='major, minor'
+    _log(
+        "\n" + "="*60,
+        "SCENARIO 2: Actual Version Release",
+        "="*60,
     )
-    print(f"✓ Created project: {project.project_name}")
-    
-    # Add components
-    components = [
-        StackComponent.objects.create(
-            project=project,
-            category='library',
-            key='library',
-            name='django',
-            version='4.2',
-            scope=''
-        ),
-        StackComponent.objects.create(
-            project=project,
-            category='library',
-            key='library',
-            name='requests',
-            version='2.30.0',
-            scope=''
-        )
-    ]
-    print(f"✓ Created {len(components)} stack components")
-    
-    # Create update cache entries (actual releases)
-    updates = [
-        UpdateCache.objects.create(
-            project=project,
-            library='django',
-            version='5.0',
-            category='major',
-            release_date=datetime.now().strftime("%Y-%m-%d"),
-            summary='Major release with async ORM support, improved admin interface, and Python 3.10+ requirement',
-            source='https://docs.djangoproject.com/en/5.0/releases/5.0/'
-        ),
-        UpdateCache.objects.create(
-            project=project,
-            library='requests',
-            version='2.31.0',
-            category='minor',
-            release_date=datetime.now().strftime("%Y-%m-%d"),
-            summary='Bug fixes and security improvements',
-            source='https://github.com/psf/requests/releases/tag/v2.31.0'
+    
+    today = datetime.now().strftime("%Y-%m-%d")
+    
+    # All scenario rows commit together; the email is sent after the commit
+    with transaction.atomic():
+        # Create project
+        project, created = _get_or_create_project(
+            project_name='E-Commerce Backend',
+            developer_names='Carol Davis, David Wilson',
+            developer_emails='carol@example.com, david@example.com',
+            notification_type='major, minor'
         )
-    ]
-    print(f"✓ Created {len(updates)} update cache entries")
+        _log(f"✓ {'Created' if created else 'Reusing'} project: {project.project_name}")
+    
+        # Add components
+        if created:
+            components = bulk_create_components([
+                StackComponent(
+                    project=project,
+                    category='library',
+                    key='library',
+                    name='django',
+                    version='4.2',
+                    scope=''
+                ),
+                StackComponent(
+                    project=project,
+                    category='library',
+                    key='library',
+                    name='requests',
+                    version='2.30.0',
+                    scope=''
+                )
+            ], batch_size=FIXTURE_BATCH_SIZE)
+        else:
+            components = list(project.components.all())
+        _log(f"✓ Created {len(components)} stack components")
+    
+        # Create update cache entries (actual releases)
+        updates = UpdateCache.objects.bulk_create([
+            UpdateCache(
+                project=project,
+                library='django',
+                version='5.0',
+                category='major',
+                release_date=today,
+                summary='Major release with async ORM support, improved admin interface, and Python 3.10+ requirement',
+                source='https://docs.djangoproject.com/en/5.0/releases/5.0/'
+            ),
+            UpdateCache(
+                project=project,
+                library='requests',
+                version='2.31.0',
+                category='minor',
+                release_date=today,
+                summary='Bug fixes and security improvements',
+                source='https://github.com/psf/requests/releases/tag/v2.31.0'
+            )
+        ], batch_size=FIXTURE_BATCH_SIZE, ignore_conflicts=True)
+        _log(f"✓ Created {len(updates)} update cache entries")
     
     # Test email notification for released versions
-    print("\n" + "-"*60)
-    print("Testing Released Version Email Notification")
-    print("-"*60)
+    _log(
+        "\n" + "-"*60,
+        "Testing Released Version Email Notification",
+        "-"*60,
+    )
     
     email_updates = [
         {
@@ -251,7 +361,8 @@ def create_release_scenario():
         }
     ]
     
-    success, message = send_update_email(
+    email_status = _deliver_email(
+        defer_email,
         mailtrap_api_key=os.getenv('MAILTRAP_MAIN_KEY'),
         project_name=project.project_name,
         recipients=project.developer_emails,
@@ -264,17 +375,15 @@ def create_release_scenario():
         future_opt_in=False
     )
     
-    print(f"Email Status: {'✓ Success' if success else '✗ Failed'}")
-    print(f"Message: {message[:200]}")
-    
     return {
         'project': project,
         'components': components,
         'updates': updates,
-        'email_status': (success, message)
+        'email_status': email_status
     }
 
 
+@transaction.atomic
 def create_transition_scenario():
     """
     Create a scenario showing future update → released transition.
@@ -282,68 +391,84 @@ def create_transition_scenario():
     Returns:
         dict with created objects showing the transition
     """
-    print("\n" + "="*60)
-    print("SCENARIO 3: Future → Released Transition")
-    print("="*60)
+    _log(
+        "\n" + "="*60,
+        "SCENARIO 3: Future → Released Transition",
+        "="*60,
+    )
+    
+    now = datetime.now()
     
     # Create project
-    project = Project.objects.create(
+    project, created = _get_or_create_project(
         project_name='Data Science Platform',
         developer_names='Eve Martinez',
         developer_emails='eve@example.com',
         notification_type='major, minor, future'
     )
-    print(f"✓ Created project: {project.project_name}")
+    _log(f"✓ {'Created' if created else 'Reusing'} project: {project.project_name}")
     
     # Add component
-    component = StackComponent.objects.create(
+    component, _ = StackComponent.objects.get_or_create(
         project=project,
-        category='library',
-        key='library',
         name='scikit-learn',
-        version='1.3.0',
-        scope=''
+        defaults={
+            'category': 'library',
+            'key': 'library',
+            'version': '1.3.0',
+            'scope': ''
+        }
     )
-    print(f"✓ Created component: {component.name} {component.version}")
+    _log(f"✓ Created component: {component.name} {component.version}")
     
     # Step 1: Detect future update
-    future_update = FutureUpdateCache.objects.create(
+    future_update, _ = FutureUpdateCache.objects.get_or_create(
         library='scikit-learn',
         version='1.4.0',
-        confidence=92,
-        expected_date=(datetime.now() + timedelta(days=45)).date(),
-        features='New estimators, improved performance, enhanced documentation',
-        source='https://scikit-learn.org/dev/whats_new.html',
-        status='confirmed',
-        notification_sent=True,
-        notification_sent_at=datetime.now()
+        defaults={
+            'confidence': 92,
+            'expected_date': (now + timedelta(days=45)).date(),
+            'features': 'New estimators, improved performance, enhanced documentation',
+            'source': 'https://scikit-learn.org/dev/whats_new.html',
+            'status': 'confirmed',
+            'notification_sent': True,
+            'notification_sent_at': now
+        }
+    )
+    _log(
+        f"✓ Step 1: Future update detected and notified",
+        f"  Library: {future_update.library} {future_update.version}",
+        f"  Confidence: {future_update.confidence}%",
+        f"  Expected: {future_update.expected_date}",
     )
-    print(f"✓ Step 1: Future update detected and notified")
-    print(f"  Library: {future_update.library} {future_update.version}")
-    print(f"  Confidence: {future_update.confidence}%")
-    print(f"  Expected: {future_update.expected_date}")
     
     # Step 2: Version is released
-    released_update = UpdateCache.objects.create(
+    released_update, _ = UpdateCache.objects.get_or_create(
         project=project,
         library='scikit-learn',
-        version='1.4.0',
-        category='major',
-        release_date=datetime.now().strftime("%Y-%m-%d"),
-        summary=future_update.features,
-        source='https://scikit-learn.org/stable/whats_new/v1.4.html'
+        defaults={
+            'version': '1.4.0',
+            'category': 'major',
+            'release_date': now.strftime("%Y-%m-%d"),
+            'summary': future_update.features,
+            'source': 'https://scikit-learn.org/stable/whats_new/v1.4.html'
+        }
+    )
+    _log(
+        f"\n✓ Step 2: Version officially released",
+        f"  Library: {released_update.library} {released_update.version}",
+        f"  Category: {released_update.category}",
     )
-    print(f"\n✓ Step 2: Version officially released")
-    print(f"  Library: {released_update.library} {released_update.version}")
-    print(f"  Category: {released_update.category}")
     
     # Step 3: Link future to released
     future_update.promoted_to_release = released_update
     future_update.status = 'released'
     future_update.save()
-    print(f"\n✓ Step 3: Future update promoted to released")
-    print(f"  Status: {future_update.status}")
-    print(f"  Linked to: UpdateCache#{released_update.id}")
+    _log(
+        f"\n✓ Step 3: Future update promoted to released",
+        f"  Status: {future_update.status}",
+        f"  Linked to: UpdateCache#{released_update.id}",
+    )
     
     return {
         'project': project,
@@ -356,22 +481,36 @@ def create_transition_scenario():
 
 def run_all_scenarios():
     """Run all mock data scenarios."""
-    print("\n" + "="*60)
-    print("LibTrack AI - Mock Data Examples")
-    print("="*60)
+    _log(
+        "\n" + "="*60,
+        "LibTrack AI - Mock Data Examples",
+        "="*60,
+    )
     
-    scenario1 = create_future_update_scenario()
-    scenario2 = create_release_scenario()
+    scenario1 = create_future_update_scenario(defer_email=True)
+    scenario2 = create_release_scenario(defer_email=True)
     scenario3 = create_transition_scenario()
     
-    print("\n" + "="*60)
-    print("Summary")
-    print("="*60)
-    print(f"✓ Created {Project.objects.count()} projects")
-    print(f"✓ Created {StackComponent.objects.count()} components")
-    print(f"✓ Created {FutureUpdateCache.objects.count()} future updates")
-    print(f"✓ Created {UpdateCache.objects.count()} released updates")
-    print("\nAll scenarios completed successfully!")
+    # Both notifications go out together once every scenario is in the database
+    email_results = flush_emails()
+    for scenario in (scenario1, scenario2):
+        scenario['email_status'] = email_results.get(scenario['project'].project_name)
+    
+    _log(
+        "\n" + "="*60,
+        "Summary",
+        "="*60,
+    )
+    projects, components, futures, releases = count_rows(
+        Project, StackComponent, FutureUpdateCache, UpdateCache
+    )
+    _log(
+        f"✓ Created {projects} projects",
+        f"✓ Created {components} components",
+        f"✓ Created {futures} future updates",
+        f"✓ Created {releases} released updates",
+        "\nAll scenarios completed successfully!",
+    )
     
     return {
         'scenario1_future': scenario1,
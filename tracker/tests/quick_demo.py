@@ -7,24 +7,20 @@ Run with: python tracker/tests/quick_demo.py
 """
 import os
 import sys
-import django
+from datetime import datetime
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'libtrack_ai.settings')
-django.setup()
+def setup_django():
+    """Bootstrap Django unless it is already running (e.g. inside a pytest session)."""
+    import django
+    from django.apps import apps
 
-from datetime import datetime, timedelta
-from tracker.models import Project, StackComponent, UpdateCache, FutureUpdateCache
-from tracker.tests.test_fixtures import (
-    ProjectFactory,
-    ComponentFactory,
-    FutureUpdateFactory,
-    UpdateCacheFactory,
-    MockDataBuilder
-)
+    if apps.ready:
+        return
+    # Add project root to path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'libtrack_ai.settings')
+    django.setup()
 
 
 def print_section(title):
@@ -36,10 +32,14 @@ def print_section(title):
 
 def demo_future_update_detection():
     """Demonstrate future update detection scenario."""
+    from tracker.tests.test_fixtures import (
+        create_future_enabled_project, create_high_confidence_future, create_library,
+    )
+
     print_section("SCENARIO 1: Future Update Detection")
     
     # Create project with future notifications enabled
-    project = ProjectFactory.create_future_enabled_project(
+    project = create_future_enabled_project(
         project_name='Demo AI Platform',
         developer_emails='demo@example.com'
     )
@@ -47,13 +47,13 @@ def demo_future_update_detection():
     print(f"  Notification types: {project.notification_type}")
     
     # Add a component
-    component = ComponentFactory.create_library(
+    component = create_library(
         project, name='numpy', version='1.24.0'
     )
     print(f"✓ Added component: {component.name} {component.version}")
     
     # Create a high-confidence future update
-    future = FutureUpdateFactory.create_high_confidence_future(
+    future = create_high_confidence_future(
         library='numpy',
         version='2.0.0',
         confidence=95
@@ -80,23 +80,25 @@ def demo_future_update_detection():
 
 def demo_release_scenario():
     """Demonstrate actual release scenario."""
+    from tracker.tests.test_fixtures import create_basic_project, create_library, create_major_release
+
     print_section("SCENARIO 2: Actual Version Release")
     
     # Create project
-    project = ProjectFactory.create_basic_project(
+    project = create_basic_project(
         project_name='Demo Web App',
         developer_emails='webapp@example.com'
     )
     print(f"✓ Created project: {project.project_name}")
     
     # Add component
-    component = ComponentFactory.create_library(
+    component = create_library(
         project, name='django', version='4.2'
     )
     print(f"✓ Added component: {component.name} {component.version}")
     
     # Create a released update
-    released = UpdateCacheFactory.create_major_release(
+    released = create_major_release(
         project=project,
         library='django',
         version='5.0'
@@ -122,10 +124,12 @@ def demo_release_scenario():
 
 def demo_future_to_released_transition():
     """Demonstrate future → released transition."""
+    from tracker.tests.test_fixtures import build_future_to_released_scenario, create_update_cache
+
     print_section("SCENARIO 3: Future → Released Transition")
     
     # Build the scenario
-    scenario = MockDataBuilder.build_future_to_released_scenario()
+    scenario = build_future_to_released_scenario()
     project = scenario['project']
     future = scenario['future_update']
     
@@ -148,7 +152,7 @@ def demo_future_to_released_transition():
     
     # Simulate release
     print(f"\n🚀 STEP 2: Version officially released")
-    released = UpdateCacheFactory.create_update_cache(
+    released = create_update_cache(
         project=project,
         library=future.library,
         version=future.version,
@@ -182,16 +186,20 @@ def demo_future_to_released_transition():
 
 def demo_notification_preferences():
     """Demonstrate notification preference filtering."""
+    from tracker.tests.test_fixtures import (
+        create_basic_project, create_future_enabled_project, create_major_only_project,
+    )
+
     print_section("SCENARIO 4: Notification Preference Testing")
     
     # Create projects with different preferences
     projects = [
-        ProjectFactory.create_major_only_project(project_name='Major Only Project'),
-        ProjectFactory.create_basic_project(
+        create_major_only_project(project_name='Major Only Project'),
+        create_basic_project(
             project_name='Major+Minor Project',
             notification_type='major, minor'
         ),
-        ProjectFactory.create_future_enabled_project(
+        create_future_enabled_project(
             project_name='All Updates Project',
             notification_type='major, minor, future'
         )
@@ -202,7 +210,7 @@ def demo_notification_preferences():
         print(f"  Preferences: {proj.notification_type}")
         print(f"  Would receive:")
         
-        prefs = [p.strip() for p in proj.notification_type.split(',')]
+        prefs = proj.notification_prefs
         if 'major' in prefs:
             print(f"    - Major updates ✓")
         if 'minor' in prefs:
@@ -215,6 +223,10 @@ def demo_notification_preferences():
 
 def main():
     """Run all demonstrations."""
+    setup_django()
+    from tracker.models import Project, StackComponent, UpdateCache, FutureUpdateCache
+    from tracker.tests.test_fixtures import count_rows
+
     print("\n" + "="*70)
     print("  LibTrack AI - Mock Data Test Suite Demonstration")
     print("="*70)
@@ -232,10 +244,13 @@ def main():
         print_section("Summary")
         print(f"\n✅ Successfully demonstrated all scenarios!")
         print(f"\nDatabase entries created:")
-        print(f"  - Projects: {Project.objects.count()}")
-        print(f"  - Components: {StackComponent.objects.count()}")
-        print(f"  - Future updates: {FutureUpdateCache.objects.count()}")
-        print(f"  - Released updates: {UpdateCache.objects.count()}")
+        projects, components, futures, releases = count_rows(
+            Project, StackComponent, FutureUpdateCache, UpdateCache
+        )
+        print(f"  - Projects: {projects}")
+        print(f"  - Components: {components}")
+        print(f"  - Future updates: {futures}")
+        print(f"  - Released updates: {releases}")
         
         print(f"\n📝 Next steps:")
         print(f"  1. View created data in Django admin")
@@ -0,0 +1,19 @@
+"""
+Tests for comma-separated field parsing (emails, notification types).
+"""
+from tracker.utils.csv_fields import split_csv
+
+
+class TestSplitCsv:
+    """Test split_csv trimming and empty-item handling."""
+
+    def test_trims_whitespace_around_items(self):
+        assert split_csv(" a@x.com ,b@x.com,  c@x.com ") == ["a@x.com", "b@x.com", "c@x.com"]
+
+    def test_drops_empty_items(self):
+        assert split_csv("major,, minor ,") == ["major", "minor"]
+
+    def test_empty_values(self):
+        assert split_csv("") == []
+        assert split_csv("   ") == []
+        assert split_csv(None) == []
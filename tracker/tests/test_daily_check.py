@@ -0,0 +1,209 @@
+"""
+Tests for the run_daily_check management command helpers.
+
+This module tests:
+1. Auto-mode scheduling arithmetic
+2. --time argument validation
+3. Failed lookups are not recorded as checked
+4. Library checks for released and future analyses
+5. Missed-run detection after a restart
+6. Per-recipient digest grouping
+7. Release date parsing for UpdateCache
+"""
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+from tracker.management.commands.run_daily_check import Command
+from tracker.utils.dates import parse_release_date
+
+
+class TestAutoSchedule:
+    """Test the sleep-until-next-run calculation used by --auto."""
+
+    def test_run_later_today(self):
+        now = datetime(2025, 12, 5, 8, 30, 0)
+        assert Command._seconds_until("09:00", now=now) == 30 * 60
+
+    def test_run_time_already_passed_rolls_to_tomorrow(self):
+        now = datetime(2025, 12, 5, 9, 0, 0)
+        assert Command._seconds_until("09:00", now=now) == 24 * 60 * 60
+
+    def test_partial_seconds_are_accounted_for(self):
+        now = datetime(2025, 12, 5, 23, 59, 30, 500000)
+        assert Command._seconds_until("00:00", now=now) == 29.5
+
+    def test_dst_start_keeps_local_run_time(self):
+        # Clocks in New York jump from 02:00 to 03:00 on 2025-03-09, so only 20h elapse
+        now = datetime(2025, 3, 8, 12, 0, 0, tzinfo=ZoneInfo("America/New_York"))
+        assert Command._seconds_until("09:00", now=now) == 20 * 60 * 60
+
+    def test_dst_end_keeps_local_run_time(self):
+        # Clocks in New York fall back from 02:00 to 01:00 on 2025-11-02, so 22h elapse
+        now = datetime(2025, 11, 1, 12, 0, 0, tzinfo=ZoneInfo("America/New_York"))
+        assert Command._seconds_until("09:00", now=now) == 22 * 60 * 60
+
+
+class TestMissedRun:
+    """Test detection of a daily run missed while the process was down."""
+
+    def test_restart_after_run_time_without_run_today(self):
+        now = datetime(2025, 12, 5, 9, 5, 0)
+        assert Command._missed_todays_run("09:00", now - timedelta(days=1), now=now)
+
+    def test_already_ran_today(self):
+        now = datetime(2025, 12, 5, 9, 5, 0)
+        assert not Command._missed_todays_run("09:00", datetime(2025, 12, 5, 9, 0, 2), now=now)
+
+    def test_before_run_time(self):
+        now = datetime(2025, 12, 5, 8, 55, 0)
+        assert not Command._missed_todays_run("09:00", now - timedelta(days=1), now=now)
+
+    def test_never_ran(self):
+        now = datetime(2025, 12, 5, 9, 5, 0)
+        assert Command._missed_todays_run("09:00", None, now=now)
+
+
+class TestTimeFormatValidation:
+    """Test --time HH:MM validation."""
+
+    def test_valid_times(self):
+        assert Command._is_valid_time_format("00:00")
+        assert Command._is_valid_time_format("09:00")
+        assert Command._is_valid_time_format("23:59")
+
+    def test_invalid_times(self):
+        assert not Command._is_valid_time_format("24:00")
+        assert not Command._is_valid_time_format("9am")
+        assert not Command._is_valid_time_format("9:00")
+        assert not Command._is_valid_time_format("")
+        assert not Command._is_valid_time_format(None)
+
+
+class TestFailedLookups:
+    """Test that failed Serper/Groq lookups are remembered so the library is retried."""
+
+    def _run(self, command, serper_results):
+        return command._evaluate_component(
+            project=None,
+            name="django",
+            current_version="5.0",
+            groq=MagicMock(),
+            serper=MagicMock(),
+            notify_pref="all",
+            component_type="library",
+            is_library_check=True,
+            serper_results=serper_results,
+        )
+
+    def test_serper_error_marks_lookup_failed(self):
+        command = Command()
+        assert self._run(command, {"error": "HTTP 500", "results": []}) is None
+        assert "django" in command._failed_lookups
+
+    def test_groq_error_marks_lookup_failed(self):
+        command = Command()
+        groq = MagicMock()
+        groq.analyze.return_value = {"error": "rate limited"}
+        result = command._evaluate_component(
+            project=None,
+            name="django",
+            current_version="5.0",
+            groq=groq,
+            serper=MagicMock(),
+            notify_pref="all",
+            component_type="library",
+            is_library_check=True,
+            serper_results={"results": [{"title": "Django 5.1 released"}]},
+        )
+        assert result is None
+        assert "django" in command._failed_lookups
+
+
+class TestLibraryCheckAnalysis:
+    """Test how a library check turns Serper results and Groq's analysis into an update."""
+
+    def _evaluate(self, command, groq, serper, serper_results):
+        return command._evaluate_component(
+            project=None,
+            name="pandas",
+            current_version="2.2.0",
+            groq=groq,
+            serper=serper,
+            notify_pref="all",
+            component_type="library",
+            is_library_check=True,
+            serper_results=serper_results,
+        )
+
+    def test_prefetched_serper_results_reach_groq(self, serper_response_variant):
+        groq, serper = MagicMock(), MagicMock()
+        groq.analyze.return_value = {"error": "stop after the lookup"}
+        self._evaluate(Command(), groq, serper, serper_response_variant)
+
+        serper.search_library.assert_not_called()
+        groq.analyze.assert_called_once_with("pandas", serper_response_variant)
+
+    def test_only_released_versions_are_returned(self, groq_analysis_variant):
+        groq = MagicMock()
+        groq.analyze.return_value = groq_analysis_variant
+        result = self._evaluate(Command(), groq, MagicMock(), {"organic": []})
+
+        if groq_analysis_variant["is_released"]:
+            assert result["version"] == "3.0.0"
+            assert result["is_released"] is True
+        else:
+            # Library checks track released versions only; "all" does not opt into futures
+            assert result is None
+
+
+class TestRecipientDigests:
+    """Test that updates are merged into one digest per recipient."""
+
+    def test_projects_are_merged_per_recipient(self):
+        django = {"library": "django", "version": "5.1"}
+        react = {"library": "react", "version": "19.0.0"}
+        jobs = Command()._recipient_jobs({
+            "dev@example.com": [("Shop", [django]), ("Blog", [django, react])],
+            "ops@example.com": [("Blog", [django, react])],
+        })
+
+        assert len(jobs) == 2
+        dev = jobs[0]
+        assert dev["recipients"] == ["dev@example.com"]
+        assert dev["project_name"] == "Shop, Blog"
+        assert dev["updates"] == [django, react]
+        assert dev["library"] == "django + 1 others"
+
+    def test_one_digest_per_recipient_in_one_batch(self, mock_email_send):
+        command = Command()
+        django = {"library": "django", "version": "5.1"}
+        command._send_digests(command._recipient_jobs({
+            "dev@example.com": [("Shop", [django]), ("Blog", [django])],
+            "ops@example.com": [("Blog", [django])],
+        }))
+
+        # Every digest goes out in a single batch call
+        mock_email_send.assert_called_once()
+        messages = mock_email_send.call_args.args[1]
+        assert sorted(message["recipients"][0] for message in messages) == ["dev@example.com", "ops@example.com"]
+
+
+class TestReleaseDateParsing:
+    """Test conversion of Groq release dates before they are stored."""
+
+    def test_iso_date(self):
+        assert parse_release_date("2024-12-01") == date(2024, 12, 1)
+
+    def test_dashboard_formats(self):
+        """Layouts the dashboard displays as dates are stored as dates too."""
+        assert parse_release_date("December 1, 2024") == date(2024, 12, 1)
+        assert parse_release_date("01/12/2024") == date(2024, 12, 1)
+        assert parse_release_date("2024/12/01") == date(2024, 12, 1)
+        assert parse_release_date("2024-12-01T10:00:00Z") == date(2024, 12, 1)
+
+    def test_placeholders_become_none(self):
+        assert parse_release_date("Q1 2025") is None
+        assert parse_release_date("Not Confirmed") is None
+        assert parse_release_date("") is None
+        assert parse_release_date(None) is None
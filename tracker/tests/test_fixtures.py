@@ -1,246 +1,449 @@
 """
 Mock data factories and utilities for testing.
 """
+import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache
+from django.db import connection, transaction
 from tracker.models import Project, StackComponent, UpdateCache, FutureUpdateCache
+from tracker.signals import bulk_create_components
 
+# Rows per INSERT for the bulk factories; CI can tune it through the environment
+FIXTURE_BATCH_SIZE = int(os.getenv("FIXTURE_BATCH_SIZE", "100"))
 
+# Clock shared by every factory; read once, then frozen until reset_clock()
+_NOW = None
+
+
+def _now():
+    """Return the factories' frozen "now", reading the clock on first use."""
+    global _NOW
+    if _NOW is None:
+        _NOW = datetime.now()
+    return _NOW
+
+
+@lru_cache(maxsize=1)
+def _today_str():
+    """The frozen date formatted as stored in UpdateCache.release_date fixtures."""
+    return _now().strftime("%Y-%m-%d")
+
+
+@lru_cache(maxsize=128)
+def _future_date(days):
+    """The frozen date shifted by ``days``."""
+    return _now().date() + timedelta(days=days)
+
+
+def reset_clock():
+    """Forget the frozen time so the next factory call reads the clock again."""
+    global _NOW
+    _NOW = None
+    _today_str.cache_clear()
+    _future_date.cache_clear()
+
+
+# Default text for generated cache rows; only formatted when the caller didn't supply the field
+_FUTURE_FEATURES_TEMPLATE = 'Planned features for {lib} {ver}'
+_FUTURE_SOURCE_TEMPLATE = 'https://{slug}.org/roadmap'
+_RELEASE_SUMMARY_TEMPLATE = 'Release summary for {lib} {ver}'
+_RELEASE_SOURCE_TEMPLATE = 'https://{slug}.org/releases/{ver}'
+
+
+# Projects
+
+def create_basic_project(**kwargs):
+    """Create a basic project with default settings."""
+    defaults = {
+        'project_name': 'Test Project',
+        'developer_names': 'John Doe, Jane Smith',
+        'developer_emails': 'john@example.com, jane@example.com',
+        'notification_type': 'major, minor'
+    }
+    defaults.update(kwargs)
+    return Project.objects.create(**defaults)
+
+
+def create_future_enabled_project(**kwargs):
+    """Create a project with future update notifications enabled."""
+    kwargs['notification_type'] = 'major, minor, future'
+    return create_basic_project(**kwargs)
+
+
+def create_major_only_project(**kwargs):
+    """Create a project that only wants major update notifications."""
+    kwargs['notification_type'] = 'major'
+    return create_basic_project(**kwargs)
+
+
+# Stack components
+
+def build_library(project, name='numpy', version='1.24.0'):
+    """Return an unsaved library component with the default fields."""
+    return StackComponent(
+        project=project,
+        category='library',
+        key='library',
+        name=name,
+        version=version,
+        scope=''
+    )
+
+
+def create_library(project, name='numpy', version='1.24.0', **kwargs):
+    """Create a library component."""
+    component = build_library(project, name, version)
+    for field, value in kwargs.items():
+        setattr(component, field, value)
+    component.save(force_insert=True)
+    return component
+
+
+def create_language(project, name='Python', version='3.11', **kwargs):
+    """Create a language component."""
+    defaults = {
+        'project': project,
+        'category': 'language',
+        'key': 'language',
+        'name': name,
+        'version': version,
+        'scope': ''
+    }
+    defaults.update(kwargs)
+    return StackComponent.objects.create(**defaults)
+
+
+def bulk_create_libraries(project, libraries, batch_size=FIXTURE_BATCH_SIZE):
+    """
+    Create library components with batched INSERTs.
+    
+    Args:
+        project: Project instance
+        libraries: Iterable of tuples (name, version)
+        batch_size: Rows per INSERT statement
+    
+    Returns:
+        List of created StackComponent instances
+    """
+    return bulk_create_components(
+        (build_library(project, name, version) for name, version in libraries),
+        batch_size=batch_size,
+    )
+
+
+def create_multiple_libraries(project, libraries):
+    """
+    Create multiple library components.
+    
+    Args:
+        project: Project instance
+        libraries: List of tuples (name, version)
+    
+    Returns:
+        List of created StackComponent instances
+    """
+    return bulk_create_libraries(project, libraries)
+
+
+# Future updates
+
+def create_future_update(
+    library='pandas',
+    version='3.0.0',
+    confidence=85,
+    days_until_release=90,
+    **kwargs
+):
+    """Create a future update entry."""
+    defaults = {
+        'library': library,
+        'version': version,
+        'confidence': confidence,
+        'expected_date': _future_date(days_until_release),
+        'status': 'detected',
+        'notification_sent': False
+    }
+    defaults.update(kwargs)
+    if 'features' not in defaults:
+        defaults['features'] = _FUTURE_FEATURES_TEMPLATE.format(lib=library, ver=version)
+    if 'source' not in defaults:
+        defaults['source'] = _FUTURE_SOURCE_TEMPLATE.format(slug=library.lower())
+    return FutureUpdateCache.objects.create(**defaults)
+
+
+def create_high_confidence_future(library='numpy', version='2.1.0', **kwargs):
+    """Create a high-confidence future update (90%+)."""
+    kwargs['confidence'] = kwargs.get('confidence', 95)
+    return create_future_update(library, version, **kwargs)
+
+
+def create_low_confidence_future(library='scipy', version='2.0.0', **kwargs):
+    """Create a low-confidence future update (below threshold)."""
+    kwargs['confidence'] = kwargs.get('confidence', 50)
+    return create_future_update(library, version, **kwargs)
+
+
+def create_notified_future(library='matplotlib', version='4.0.0', **kwargs):
+    """Create a future update that has already been notified."""
+    kwargs['notification_sent'] = True
+    kwargs['notification_sent_at'] = _now()
+    return create_future_update(library, version, **kwargs)
+
+
+# Released updates
+
+def create_update_cache(
+    project,
+    library='numpy',
+    version='2.0.0',
+    category='major',
+    **kwargs
+):
+    """Create an update cache entry."""
+    defaults = {
+        'project': project,
+        'library': library,
+        'version': version,
+        'category': category,
+        'release_date': _today_str(),
+    }
+    defaults.update(kwargs)
+    if 'summary' not in defaults:
+        defaults['summary'] = _RELEASE_SUMMARY_TEMPLATE.format(lib=library, ver=version)
+    if 'source' not in defaults:
+        defaults['source'] = _RELEASE_SOURCE_TEMPLATE.format(slug=library.lower(), ver=version)
+    return UpdateCache.objects.create(**defaults)
+
+
+def create_major_release(project, library='django', version='5.0', **kwargs):
+    """Create a major release update."""
+    kwargs['category'] = 'major'
+    return create_update_cache(project, library, version, **kwargs)
+
+
+def create_minor_release(project, library='requests', version='2.31.1', **kwargs):
+    """Create a minor release update."""
+    kwargs['category'] = 'minor'
+    return create_update_cache(project, library, version, **kwargs)
+
+
+# Composite scenarios
+
+@transaction.atomic
+def build_complete_project_scenario():
+    """
+    Build a complete project with components, updates, and future updates.
+    
+    Returns:
+        dict with project, components, updates, and future_updates
+    """
+    project = create_future_enabled_project(
+        project_name='Complete Test Project'
+    )
+    
+    # Create components
+    components = create_multiple_libraries(
+        project,
+        [
+            ('numpy', '1.24.0'),
+            ('pandas', '2.0.0'),
+            ('django', '4.2')
+        ]
+    )
+    
+    # Create some released updates
+    updates = [
+        create_major_release(
+            project, library='numpy', version='2.0.0'
+        )
+    ]
+    
+    # Create some future updates
+    future_updates = [
+        create_high_confidence_future(
+            library='pandas', version='3.0.0'
+        ),
+        create_future_update(
+            library='django', version='5.0', confidence=80
+        )
+    ]
+    
+    return {
+        'project': project,
+        'components': components,
+        'updates': updates,
+        'future_updates': future_updates
+    }
+
+
+@transaction.atomic
+def build_future_to_released_scenario():
+    """
+    Build a scenario where a future update transitions to released.
+    
+    Returns:
+        dict with project, future_update, and setup for release
+    """
+    project = create_future_enabled_project(
+        project_name='Transition Test Project'
+    )
+    
+    create_library(
+        project, name='scikit-learn', version='1.3.0'
+    )
+    
+    future_update = create_high_confidence_future(
+        library='scikit-learn',
+        version='1.4.0',
+        confidence=90
+    )
+    
+    return {
+        'project': project,
+        'future_update': future_update,
+        'library': 'scikit-learn',
+        'future_version': '1.4.0',
+        'current_version': '1.3.0'
+    }
+
+
+@contextmanager
+def no_indexes(*models):
+    """
+    Drop the non-unique secondary indexes on the models' tables, recreating them on exit.
+    
+    Unique indexes are left alone so constraints still hold during the load.
+    Only SQLite and PostgreSQL are handled; on other backends this is a no-op.
+    """
+    if connection.vendor == 'sqlite':
+        lookup = (
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = %s "
+            "AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%%'"
+        )
+    elif connection.vendor == 'postgresql':
+        lookup = (
+            "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s "
+            "AND indexdef NOT LIKE 'CREATE UNIQUE%%'"
+        )
+    else:
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        dropped = []
+        for model in models:
+            cursor.execute(lookup, [model._meta.db_table])
+            dropped.extend(cursor.fetchall())
+        for name, _ in dropped:
+            cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            for _, ddl in dropped:
+                cursor.execute(ddl)
+
+
+@transaction.atomic
+def build_perf_dataset(n=100_000, batch_size=FIXTURE_BATCH_SIZE):
+    """
+    Build one project with ``n`` library components and ``n`` future updates for load testing.
+    
+    Secondary indexes are dropped for the insert and rebuilt once at the end.
+    
+    Returns:
+        The created Project
+    """
+    project = create_future_enabled_project(project_name='Perf Test Project')
+    expected_date = _future_date(90)
+    with no_indexes(StackComponent, FutureUpdateCache):
+        bulk_create_components(
+            (build_library(project, f'perf-lib-{i}', '1.0.0') for i in range(n)),
+            batch_size=batch_size,
+        )
+        bulk_create_future_updates(
+            (
+                (f'perf-lib-{i}', '2.0.0', 85, expected_date, '', '', 'detected', False)
+                for i in range(n)
+            ),
+            batch_size=batch_size,
+        )
+    return project
+
+
+# Columns of the row tuples accepted by bulk_create_future_updates()
+FUTURE_UPDATE_ROW_FIELDS = (
+    'library', 'version', 'confidence', 'expected_date',
+    'features', 'source', 'status', 'notification_sent',
+)
+
+
+def bulk_create_future_updates(rows, batch_size=FIXTURE_BATCH_SIZE):
+    """
+    Create FutureUpdateCache rows from plain tuples with batched INSERTs.
+    
+    Args:
+        rows: Iterable of tuples ordered as FUTURE_UPDATE_ROW_FIELDS
+        batch_size: Rows per INSERT statement
+    """
+    return FutureUpdateCache.objects.bulk_create(
+        (FutureUpdateCache(**dict(zip(FUTURE_UPDATE_ROW_FIELDS, row))) for row in rows),
+        batch_size=batch_size,
+    )
+
+
+def count_rows(*models):
+    """Return the row count of each model, fetched together in a single query."""
+    columns = ", ".join(
+        f"(SELECT COUNT(*) FROM {connection.ops.quote_name(model._meta.db_table)})"
+        for model in models
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {columns}")
+        return cursor.fetchone()
+
+
+# Class namespaces kept for existing callers; each attribute is the module-level function
 class ProjectFactory:
     """Factory for creating test projects with various configurations."""
-    
-    @staticmethod
-    def create_basic_project(**kwargs):
-        """Create a basic project with default settings."""
-        defaults = {
-            'project_name': 'Test Project',
-            'developer_names': 'John Doe, Jane Smith',
-            'developer_emails': 'john@example.com, jane@example.com',
-            'notification_type': 'major, minor'
-        }
-        defaults.update(kwargs)
-        return Project.objects.create(**defaults)
-    
-    @staticmethod
-    def create_future_enabled_project(**kwargs):
-        """Create a project with future update notifications enabled."""
-        kwargs['notification_type'] = 'major, minor, future'
-        return ProjectFactory.create_basic_project(**kwargs)
-    
-    @staticmethod
-    def create_major_only_project(**kwargs):
-        """Create a project that only wants major update notifications."""
-        kwargs['notification_type'] = 'major'
-        return ProjectFactory.create_basic_project(**kwargs)
+
+    create_basic_project = staticmethod(create_basic_project)
+    create_future_enabled_project = staticmethod(create_future_enabled_project)
+    create_major_only_project = staticmethod(create_major_only_project)
 
 
 class ComponentFactory:
     """Factory for creating stack components."""
-    
-    @staticmethod
-    def create_library(project, name='numpy', version='1.24.0', **kwargs):
-        """Create a library component."""
-        defaults = {
-            'project': project,
-            'category': 'library',
-            'key': 'library',
-            'name': name,
-            'version': version,
-            'scope': ''
-        }
-        defaults.update(kwargs)
-        return StackComponent.objects.create(**defaults)
-    
-    @staticmethod
-    def create_language(project, name='Python', version='3.11', **kwargs):
-        """Create a language component."""
-        defaults = {
-            'project': project,
-            'category': 'language',
-            'key': 'language',
-            'name': name,
-            'version': version,
-            'scope': ''
-        }
-        defaults.update(kwargs)
-        return StackComponent.objects.create(**defaults)
-    
-    @staticmethod
-    def create_multiple_libraries(project, libraries):
-        """
-        Create multiple library components.
-        
-        Args:
-            project: Project instance
-            libraries: List of tuples (name, version)
-        
-        Returns:
-            List of created StackComponent instances
-        """
-        components = []
-        for name, version in libraries:
-            components.append(
-                ComponentFactory.create_library(project, name=name, version=version)
-            )
-        return components
+
+    build_library = staticmethod(build_library)
+    create_library = staticmethod(create_library)
+    create_language = staticmethod(create_language)
+    bulk_create_libraries = staticmethod(bulk_create_libraries)
+    create_multiple_libraries = staticmethod(create_multiple_libraries)
 
 
 class FutureUpdateFactory:
     """Factory for creating future update cache entries."""
-    
-    @staticmethod
-    def create_future_update(
-        library='pandas',
-        version='3.0.0',
-        confidence=85,
-        days_until_release=90,
-        **kwargs
-    ):
-        """Create a future update entry."""
-        defaults = {
-            'library': library,
-            'version': version,
-            'confidence': confidence,
-            'expected_date': (datetime.now() + timedelta(days=days_until_release)).date(),
-            'features': f'Planned features for {library} {version}',
-            'source': f'https://{library.lower()}.org/roadmap',
-            'status': 'detected',
-            'notification_sent': False
-        }
-        defaults.update(kwargs)
-        return FutureUpdateCache.objects.create(**defaults)
-    
-    @staticmethod
-    def create_high_confidence_future(library='numpy', version='2.1.0', **kwargs):
-        """Create a high-confidence future update (90%+)."""
-        kwargs['confidence'] = kwargs.get('confidence', 95)
-        return FutureUpdateFactory.create_future_update(library, version, **kwargs)
-    
-    @staticmethod
-    def create_low_confidence_future(library='scipy', version='2.0.0', **kwargs):
-        """Create a low-confidence future update (below threshold)."""
-        kwargs['confidence'] = kwargs.get('confidence', 50)
-        return FutureUpdateFactory.create_future_update(library, version, **kwargs)
-    
-    @staticmethod
-    def create_notified_future(library='matplotlib', version='4.0.0', **kwargs):
-        """Create a future update that has already been notified."""
-        kwargs['notification_sent'] = True
-        kwargs['notification_sent_at'] = datetime.now()
-        return FutureUpdateFactory.create_future_update(library, version, **kwargs)
+
+    create_future_update = staticmethod(create_future_update)
+    create_high_confidence_future = staticmethod(create_high_confidence_future)
+    create_low_confidence_future = staticmethod(create_low_confidence_future)
+    create_notified_future = staticmethod(create_notified_future)
+    bulk_create_future_updates = staticmethod(bulk_create_future_updates)
 
 
 class UpdateCacheFactory:
     """Factory for creating update cache entries (released versions)."""
-    
-    @staticmethod
-    def create_update_cache(
-        project,
-        library='numpy',
-        version='2.0.0',
-        category='major',
-        **kwargs
-    ):
-        """Create an update cache entry."""
-        defaults = {
-            'project': project,
-            'library': library,
-            'version': version,
-            'category': category,
-            'release_date': datetime.now().strftime("%Y-%m-%d"),
-            'summary': f'Release summary for {library} {version}',
-            'source': f'https://{library.lower()}.org/releases/{version}'
-        }
-        defaults.update(kwargs)
-        return UpdateCache.objects.create(**defaults)
-    
-    @staticmethod
-    def create_major_release(project, library='django', version='5.0', **kwargs):
-        """Create a major release update."""
-        kwargs['category'] = 'major'
-        return UpdateCacheFactory.create_update_cache(project, library, version, **kwargs)
-    
-    @staticmethod
-    def create_minor_release(project, library='requests', version='2.31.1', **kwargs):
-        """Create a minor release update."""
-        kwargs['category'] = 'minor'
-        return UpdateCacheFactory.create_update_cache(project, library, version, **kwargs)
+
+    create_update_cache = staticmethod(create_update_cache)
+    create_major_release = staticmethod(create_major_release)
+    create_minor_release = staticmethod(create_minor_release)
 
 
 class MockDataBuilder:
     """Builder for creating complex test scenarios."""
-    
-    @staticmethod
-    def build_complete_project_scenario():
-        """
-        Build a complete project with components, updates, and future updates.
-        
-        Returns:
-            dict with project, components, updates, and future_updates
-        """
-        project = ProjectFactory.create_future_enabled_project(
-            project_name='Complete Test Project'
-        )
-        
-        # Create components
-        components = ComponentFactory.create_multiple_libraries(
-            project,
-            [
-                ('numpy', '1.24.0'),
-                ('pandas', '2.0.0'),
-                ('django', '4.2')
-            ]
-        )
-        
-        # Create some released updates
-        updates = [
-            UpdateCacheFactory.create_major_release(
-                project, library='numpy', version='2.0.0'
-            )
-        ]
-        
-        # Create some future updates
-        future_updates = [
-            FutureUpdateFactory.create_high_confidence_future(
-                library='pandas', version='3.0.0'
-            ),
-            FutureUpdateFactory.create_future_update(
-                library='django', version='5.0', confidence=80
-            )
-        ]
-        
-        return {
-            'project': project,
-            'components': components,
-            'updates': updates,
-            'future_updates': future_updates
-        }
-    
-    @staticmethod
-    def build_future_to_released_scenario():
-        """
-        Build a scenario where a future update transitions to released.
-        
-        Returns:
-            dict with project, future_update, and setup for release
-        """
-        project = ProjectFactory.create_future_enabled_project(
-            project_name='Transition Test Project'
-        )
-        
-        ComponentFactory.create_library(
-            project, name='scikit-learn', version='1.3.0'
-        )
-        
-        future_update = FutureUpdateFactory.create_high_confidence_future(
-            library='scikit-learn',
-            version='1.4.0',
-            confidence=90
-        )
-        
-        return {
-            'project': project,
-            'future_update': future_update,
-            'library': 'scikit-learn',
-            'future_version': '1.4.0',
-            'current_version': '1.3.0'
-        }
+
+    build_complete_project_scenario = staticmethod(build_complete_project_scenario)
+    build_future_to_released_scenario = staticmethod(build_future_to_released_scenario)
+    build_perf_dataset = staticmethod(build_perf_dataset)
@@ -9,13 +9,14 @@ This module tests:
 5. Duplicate notification prevention
 """
 import pytest
+import requests
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import Mock, patch
 from django.test import TestCase
 
 from tracker.models import FutureUpdateCache, Project
-from tracker.management.commands.run_daily_check import Command
-from tracker.utils.send_mail import send_update_email
+from tracker.management.commands.run_daily_check import MIN_CONFIDENCE, Command, should_notify_confidence
+from tracker.utils.send_mail import MAILTRAP_BATCH, send_update_email, send_update_email_batch
 from tracker.tests.test_fixtures import (
     ProjectFactory,
     ComponentFactory,
@@ -88,26 +89,18 @@ class TestFutureUpdateDetection:
             confidence=40
         )
         
-        # Simulate the threshold check (MIN_CONFIDENCE = 70 in run_daily_check.py)
-        MIN_CONFIDENCE = 70
-        should_notify = low_conf.confidence >= MIN_CONFIDENCE
+        # Same threshold check the daily run applies
+        should_notify = should_notify_confidence(low_conf.confidence)
         
         assert not should_notify
         assert low_conf.confidence < MIN_CONFIDENCE
 
 
-@pytest.mark.django_db
 class TestFutureUpdateNotifications:
-    """Test email notifications for future updates."""
+    """Test email notifications for future updates (rendering only, no database)."""
     
-    def test_future_update_email_content(self, mock_project):
+    def test_future_update_email_content(self):
         """Test that future update emails contain correct information."""
-        project = mock_project(
-            project_name='Test Project',
-            developer_emails='dev@test.com',
-            notification_type='major, minor, future'
-        )
-        
         # Mock environment variables
         with patch.dict('os.environ', {
             'TEST_MODE': 'True',
@@ -140,10 +133,8 @@ class TestFutureUpdateNotifications:
         assert success
         assert 'Test email sent' in message
     
-    def test_future_update_subject_line(self, mock_project):
+    def test_future_update_subject_line(self):
         """Test that future updates have distinct subject lines."""
-        project = mock_project(notification_type='major, minor, future')
-        
         with patch.dict('os.environ', {
             'TEST_MODE': 'True',
             'MAILTRAP_MAIN_KEY': 'test_key',
@@ -164,10 +155,8 @@ class TestFutureUpdateNotifications:
         # The subject should contain "Future Update Alert"
         assert success
     
-    def test_confidence_in_email(self, mock_project):
+    def test_confidence_in_email(self):
         """Test that confidence percentage appears in future update emails."""
-        project = mock_project(notification_type='major, minor, future')
-        
         with patch.dict('os.environ', {
             'TEST_MODE': 'True',
             'MAILTRAP_MAIN_KEY': 'test_key',
@@ -175,7 +164,7 @@ class TestFutureUpdateNotifications:
         }):
             # Capture the HTML content
             with patch('tracker.utils.send_mail.requests.post') as mock_post:
-                mock_response = MagicMock()
+                mock_response = Mock(spec=requests.Response)
                 mock_response.status_code = 200
                 mock_post.return_value = mock_response
                 
@@ -200,6 +189,55 @@ class TestFutureUpdateNotifications:
                     }],
                     future_opt_in=True
                 )
+    
+    def test_update_with_unhashable_extra_field(self):
+        """Test that update dicts may carry extra non-hashable fields the email doesn't render."""
+        success, _ = send_update_email(
+            mailtrap_api_key='test_key',
+            project_name='Test Project',
+            recipients='dev@test.com',
+            library='pandas',
+            version='3.0.0',
+            category='major',
+            summary='Release',
+            source='https://pandas.org',
+            from_email='noreply@libtrack.com',
+            updates=[{'library': 'pandas', 'version': '3.0.0', 'tags': ['a']}],
+            test_mode=True
+        )
+        
+        assert success
+    
+    def test_batch_email_payload(self, mock_mailtrap_success):
+        """Test that batched notifications go out in one request with a shared base payload."""
+        messages = [
+            {
+                'project_name': name,
+                'recipients': 'dev@test.com',
+                'library': 'pandas',
+                'version': '3.0.0',
+                'category': 'future',
+                'summary': 'Planned major rewrite',
+                'source': 'https://pandas.org/roadmap',
+                'future_opt_in': True,
+            }
+            for name in ('Project A', 'Project B')
+        ]
+        
+        success, _ = send_update_email_batch(
+            'test_key', messages, from_email='noreply@libtrack.com', test_mode=False
+        )
+        
+        assert success
+        mock_mailtrap_success.assert_called_once()
+        args, kwargs = mock_mailtrap_success.call_args
+        assert args[0] == MAILTRAP_BATCH
+        payload = kwargs['json']
+        assert 'from' in payload['base']
+        assert len(payload['requests']) == 2
+        for entry in payload['requests']:
+            assert entry['to'] == [{'email': 'dev@test.com'}]
+            assert 'Future Update Alert' in entry['subject']
 
 
 @pytest.mark.django_db
@@ -246,26 +284,25 @@ class TestDuplicateNotificationPrevention:
         assert 'Updated features' in updated.features
 
 
-@pytest.mark.django_db
 class TestNotificationPreferences:
     """Test that notification preferences are respected for future updates."""
     
-    def test_future_opt_in_required(self, mock_project):
+    def test_future_opt_in_required(self):
         """Test that future updates only sent when user opts in."""
-        # Project WITHOUT future notifications enabled
-        project = mock_project(notification_type='major, minor')
+        # Project WITHOUT future notifications enabled; never saved, so no database needed
+        project = Project(notification_type='major, minor')
         
-        notify_pref = 'major, minor'
+        notify_pref = project.notification_type
         should_send = 'future' in notify_pref
         
         assert not should_send
     
-    def test_future_opt_in_enabled(self, mock_project):
+    def test_future_opt_in_enabled(self):
         """Test that future updates are sent when user opts in."""
-        # Project WITH future notifications enabled
-        project = mock_project(notification_type='major, minor, future')
+        # Project WITH future notifications enabled; never saved, so no database needed
+        project = Project(notification_type='major, minor, future')
         
-        notify_pref = 'major, minor, future'
+        notify_pref = project.notification_type
         should_send = 'future' in notify_pref
         
         assert should_send
@@ -276,3 +313,22 @@ class TestNotificationPreferences:
         
         assert 'future' not in project.notification_type
         assert 'major' in project.notification_type
+
+    def test_notification_prefs_reparsed_after_save(self, mock_project):
+        """Test that the cached preference set is refreshed when notification_type is saved."""
+        project = mock_project(notification_type='major, minor, future')
+        assert project.notification_prefs == {'major', 'minor', 'future'}
+        
+        project.notification_type = 'major'
+        project.save()
+        
+        assert project.notification_prefs == {'major'}
+
+    def test_dashboard_reads_notification_type_after_bulk_update(self, mock_project):
+        """Test that the dashboard follows notification_type even when a bulk update skips save()."""
+        from tracker.views import _serialize_project
+
+        project = mock_project(notification_type='major, minor')
+        Project.objects.filter(pk=project.pk).update(notification_type='future')
+        
+        assert _serialize_project(Project.objects.get(pk=project.pk))['notification_list'] == ['future']
@@ -8,9 +8,58 @@ This module provides utilities for:
 4. Mock API response building
 """
 import re
-from typing import Dict, List, Any
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Any
 from packaging import version as pkg_version
 
+from tracker.utils.csv_fields import split_csv
+
+# Patterns used by EmailContentValidator, compiled once at import
+_CONFIDENCE_RE = re.compile(r'(\d+)%')
+_VERSION_RE = re.compile(r'(\d+\.\d+(?:\.\d+)?)')
+# Version numbers, percent signs and tables, found together in one pass over the HTML
+_MARKERS_RE = re.compile(r'(?P<version>\d+\.\d+)|(?P<percent>%)|(?P<table><table)')
+
+# Any of these in the lowercased HTML counts as naming a library
+_KNOWN_LIBS = frozenset(('numpy', 'pandas', 'django', 'library'))
+_LIBRARY_NAME_RE = re.compile('|'.join(map(re.escape, sorted(_KNOWN_LIBS))))
+
+
+def _scan_markers(html_content: str) -> set:
+    """Names of the _MARKERS_RE groups present in the HTML, stopping once all are seen."""
+    found = set()
+    for match in _MARKERS_RE.finditer(html_content):
+        found.add(match.lastgroup)
+        if len(found) == 3:
+            break
+    return found
+
+
+def _future_email_checks(html_content: str):
+    """Yield (requirement, passed) for a future update email, one check at a time."""
+    yield 'has_future_notice', 'Future Update Notice' in html_content
+    lowered = html_content.lower()
+    markers = _scan_markers(html_content)
+    yield 'has_confidence', 'confidence' in lowered or 'percent' in markers
+    yield 'has_planned_text', 'planned' in lowered or 'upcoming' in lowered
+    yield 'has_not_released_warning', 'NOT been officially released' in html_content or 'not released' in lowered
+    yield 'has_library_name', _LIBRARY_NAME_RE.search(lowered) is not None
+    yield 'has_version', 'version' in markers
+    yield 'has_table', 'table' in markers
+
+
+def _released_email_checks(html_content: str):
+    """Yield (requirement, passed) for a released version email, one check at a time."""
+    lowered = html_content.lower()
+    yield 'has_release_summary', 'Release Summary' in html_content or 'released' in lowered
+    yield 'has_library_name', _LIBRARY_NAME_RE.search(lowered) is not None
+    markers = _scan_markers(html_content)
+    yield 'has_version', 'version' in markers
+    yield 'has_source_link', 'href=' in html_content
+    yield 'has_table', 'table' in markers
+    yield 'no_future_notice', 'Future Update Notice' not in html_content
+
 
 class EmailContentValidator:
     """Validates email content structure and required elements."""
@@ -23,16 +72,7 @@ class EmailContentValidator:
         Returns:
             dict with validation results for each requirement
         """
-        results = {
-            'has_future_notice': 'Future Update Notice' in html_content,
-            'has_confidence': 'confidence' in html_content.lower() or '%' in html_content,
-            'has_planned_text': 'planned' in html_content.lower() or 'upcoming' in html_content.lower(),
-            'has_not_released_warning': 'NOT been officially released' in html_content or 'not released' in html_content.lower(),
-            'has_library_name': any(lib in html_content.lower() for lib in ['numpy', 'pandas', 'django', 'library']),
-            'has_version': bool(re.search(r'\d+\.\d+', html_content)),
-            'has_table': '<table' in html_content,
-        }
-        return results
+        return dict(_future_email_checks(html_content))
     
     @staticmethod
     def validate_released_email(html_content: str) -> Dict[str, bool]:
@@ -42,29 +82,34 @@ class EmailContentValidator:
         Returns:
             dict with validation results for each requirement
         """
-        results = {
-            'has_release_summary': 'Release Summary' in html_content or 'released' in html_content.lower(),
-            'has_library_name': any(lib in html_content.lower() for lib in ['numpy', 'pandas', 'django', 'library']),
-            'has_version': bool(re.search(r'\d+\.\d+', html_content)),
-            'has_source_link': 'href=' in html_content,
-            'has_table': '<table' in html_content,
-            'no_future_notice': 'Future Update Notice' not in html_content,
-        }
-        return results
+        return dict(_released_email_checks(html_content))
     
     @staticmethod
     def extract_confidence_from_email(html_content: str) -> int | None:
         """Extract confidence percentage from email HTML."""
-        match = re.search(r'(\d+)%', html_content)
+        match = _CONFIDENCE_RE.search(html_content)
         return int(match.group(1)) if match else None
     
     @staticmethod
     def extract_version_from_email(html_content: str) -> str | None:
         """Extract version number from email HTML."""
-        match = re.search(r'(\d+\.\d+(?:\.\d+)?)', html_content)
+        match = _VERSION_RE.search(html_content)
         return match.group(1) if match else None
 
 
+@lru_cache(maxsize=256)
+def parse_notification_types(notify_pref: str) -> frozenset:
+    """Parse notification preference string into a set of types, memoized per string."""
+    prefs = {item.lower() for item in split_csv(notify_pref)}
+    
+    # Expand "both" to major and minor
+    if 'both' in prefs:
+        prefs.discard('both')
+        prefs.update(('major', 'minor'))
+    
+    return frozenset(prefs)
+
+
 class NotificationPreferenceChecker:
     """Utilities for checking notification preferences."""
     
@@ -80,33 +125,24 @@ class NotificationPreferenceChecker:
         Returns:
             True if notification should be sent
         """
-        prefs = [p.strip().lower() for p in notify_pref.split(',')]
-        
-        # Handle "both" legacy preference
-        if 'both' in prefs:
-            prefs.extend(['major', 'minor'])
-        
-        return category.lower() in prefs
+        return category.lower() in parse_notification_types(notify_pref)
     
-    @staticmethod
-    def parse_notification_types(notify_pref: str) -> List[str]:
-        """Parse notification preference string into list of types."""
-        if not notify_pref:
-            return []
-        
-        prefs = [p.strip().lower() for p in notify_pref.split(',')]
-        
-        # Expand "both" to major and minor
-        if 'both' in prefs:
-            prefs.remove('both')
-            prefs.extend(['major', 'minor'])
-        
-        return list(set(prefs))  # Remove duplicates
+    parse_notification_types = staticmethod(parse_notification_types)
     
     @staticmethod
     def is_future_enabled(notify_pref: str) -> bool:
         """Check if future updates are enabled in preferences."""
-        return 'future' in notify_pref.lower()
+        return 'future' in parse_notification_types(notify_pref)
+
+
+# Plain MAJOR.MINOR[.PATCH] versions compare as integer tuples without packaging
+_SEMVER_RE = re.compile(r'^(\d+)\.(\d+)(?:\.(\d+))?$')
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(version_string: str):
+    """pkg_version.parse, memoized per version string (invalid strings still raise)."""
+    return pkg_version.parse(version_string)
 
 
 class VersionComparer:
@@ -120,8 +156,15 @@ class VersionComparer:
         Returns:
             True if new_version is newer than current_version
         """
+        new_match = _SEMVER_RE.match(new_version)
+        current_match = _SEMVER_RE.match(current_version)
+        if new_match and current_match:
+            return (
+                tuple(map(int, new_match.groups(default='0')))
+                > tuple(map(int, current_match.groups(default='0')))
+            )
         try:
-            return pkg_version.parse(new_version) > pkg_version.parse(current_version)
+            return _parse_cached(new_version) > _parse_cached(current_version)
         except Exception:
             # If parsing fails, do string comparison
             return new_version > current_version
@@ -130,7 +173,7 @@ class VersionComparer:
     def parse_version(version_string: str) -> tuple | None:
         """Parse version string into comparable format."""
         try:
-            parsed = pkg_version.parse(version_string)
+            parsed = _parse_cached(version_string)
             return parsed
         except Exception:
             return None
@@ -139,12 +182,39 @@ class VersionComparer:
     def is_valid_version(version_string: str) -> bool:
         """Check if version string is valid."""
         try:
-            pkg_version.parse(version_string)
+            _parse_cached(version_string)
             return True
         except Exception:
             return False
 
 
+# Serper "organic" results; {lib}, {lib_lower} and {ver} are filled in per call
+_SERPER_FUTURE_TEMPLATES = (
+    {
+        "title": "{lib} {ver} Development Roadmap",
+        "link": "https://{lib_lower}.org/roadmap",
+        "snippet": "Planned features for {lib} {ver} include performance improvements and new APIs."
+    },
+    {
+        "title": "Upcoming: {lib} {ver}",
+        "link": "https://github.com/{lib_lower}/milestones/v{ver}",
+        "snippet": "Milestone for version {ver}. Expected release Q2 2024."
+    },
+)
+_SERPER_RELEASED_TEMPLATES = (
+    {
+        "title": "{lib} {ver} Released",
+        "link": "https://{lib_lower}.org/releases/{ver}",
+        "snippet": "Official release of {lib} {ver} with bug fixes and new features."
+    },
+    {
+        "title": "What's New in {lib} {ver}",
+        "link": "https://{lib_lower}.org/whatsnew/{ver}",
+        "snippet": "Detailed changelog for {lib} version {ver}."
+    },
+)
+
+
 class MockAPIResponseBuilder:
     """Build mock API responses for testing."""
     
@@ -167,34 +237,14 @@ class MockAPIResponseBuilder:
         Returns:
             Mock Serper API response dict
         """
-        if is_future:
-            results = [
-                {
-                    "title": f"{library} {version} Development Roadmap",
-                    "link": f"https://{library.lower()}.org/roadmap",
-                    "snippet": f"Planned features for {library} {version} include performance improvements and new APIs."
-                },
-                {
-                    "title": f"Upcoming: {library} {version}",
-                    "link": f"https://github.com/{library.lower()}/milestones/v{version}",
-                    "snippet": f"Milestone for version {version}. Expected release Q2 2024."
-                }
-            ]
-        else:
-            results = [
-                {
-                    "title": f"{library} {version} Released",
-                    "link": f"https://{library.lower()}.org/releases/{version}",
-                    "snippet": f"Official release of {library} {version} with bug fixes and new features."
-                },
-                {
-                    "title": f"What's New in {library} {version}",
-                    "link": f"https://{library.lower()}.org/whatsnew/{version}",
-                    "snippet": f"Detailed changelog for {library} version {version}."
-                }
-            ]
+        lib_lower = library.lower()
+        templates = _SERPER_FUTURE_TEMPLATES if is_future else _SERPER_RELEASED_TEMPLATES
+        results = [
+            {key: text.format(lib=library, lib_lower=lib_lower, ver=version) for key, text in template.items()}
+            for template in templates[:num_results]
+        ]
         
-        return {"organic": results[:num_results]}
+        return {"organic": results}
     
     @staticmethod
     def build_groq_analysis(
@@ -217,7 +267,7 @@ class MockAPIResponseBuilder:
         Returns:
             Mock Groq analysis dict
         """
-        from datetime import datetime, timedelta
+        now = datetime.now()
         
         analysis = {
             "library": library,
@@ -230,11 +280,11 @@ class MockAPIResponseBuilder:
         }
         
         if is_released:
-            analysis["release_date"] = datetime.now().strftime("%Y-%m-%d")
+            analysis["release_date"] = now.strftime("%Y-%m-%d")
             analysis["expected_date"] = ""
         else:
             analysis["release_date"] = ""
-            analysis["expected_date"] = (datetime.now() + timedelta(days=60)).strftime("%Y-%m-%d")
+            analysis["expected_date"] = (now + timedelta(days=60)).strftime("%Y-%m-%d")
         
         return analysis
 
@@ -250,11 +300,6 @@ def validate_all_email_requirements(html_content: str, is_future: bool = False)
     Returns:
         True if all requirements are met
     """
-    validator = EmailContentValidator()
-    
-    if is_future:
-        results = validator.validate_future_update_email(html_content)
-    else:
-        results = validator.validate_released_email(html_content)
-    
-    return all(results.values())
+    checks = _future_email_checks if is_future else _released_email_checks
+    # Stops at the first failing requirement; use EmailContentValidator for the full breakdown
+    return all(passed for _, passed in checks(html_content))
@@ -0,0 +1,76 @@
+"""
+Tests for the data migrations.
+
+The suite runs with --nomigrations, so these tests load the real migration
+graph themselves and step the schema back and forth around the migration
+under test.
+"""
+from datetime import date
+
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.db.migrations.recorder import MigrationRecorder
+
+BEFORE_DATEFIELD = [("tracker", "0009_drop_redundant_library_indexes")]
+AFTER_DATEFIELD = [("tracker", "0010_updatecache_release_date_datefield")]
+
+
+@pytest.fixture
+def migrator(settings, transactional_db):
+    """MigrationExecutor over the real migrations, with the current schema recorded as applied."""
+    settings.MIGRATION_MODULES = {}
+    recorder = MigrationRecorder(connection)
+    recorder.ensure_schema()
+    executor = MigrationExecutor(connection)
+    for app_label, name in executor.loader.graph.nodes:
+        recorder.record_applied(app_label, name)
+    executor.loader.build_graph()
+    try:
+        yield executor
+    finally:
+        # Bring the schema back to the latest state for the tests that follow
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+        recorder.flush()
+
+
+class TestReleaseDateMigration:
+    """Test 0010's conversion of the old release_date strings to dates."""
+
+    def test_known_layouts_become_dates(self, migrator):
+        migrator.migrate(BEFORE_DATEFIELD)
+        old_apps = migrator.loader.project_state(BEFORE_DATEFIELD).apps
+        Project = old_apps.get_model("tracker", "Project")
+        UpdateCache = old_apps.get_model("tracker", "UpdateCache")
+
+        project = Project.objects.create(
+            project_name="Migration Project",
+            developer_names="Dev",
+            developer_emails="dev@example.com",
+        )
+        raw_dates = {
+            "numpy": "2024-12-01",
+            "pandas": "December 1, 2024",
+            "django": "01/12/2024",
+            "requests": "2024/12/01",
+            "scipy": "Q1 2025",
+        }
+        for library, raw in raw_dates.items():
+            UpdateCache.objects.create(
+                project=project, library=library, version="1.0", release_date=raw, category="major"
+            )
+
+        migrator.loader.build_graph()
+        migrator.migrate(AFTER_DATEFIELD)
+        new_apps = migrator.loader.project_state(AFTER_DATEFIELD).apps
+        UpdateCache = new_apps.get_model("tracker", "UpdateCache")
+
+        stored = dict(UpdateCache.objects.values_list("library", "release_date"))
+        assert stored == {
+            "numpy": date(2024, 12, 1),
+            "pandas": date(2024, 12, 1),
+            "django": date(2024, 12, 1),
+            "requests": date(2024, 12, 1),
+            "scipy": None,
+        }
@@ -0,0 +1,79 @@
+"""
+Tests for the load-testing fixture helpers.
+
+This module tests:
+1. Dropping and restoring secondary indexes around bulk loads
+2. Creating future updates from plain row tuples
+3. Building a small perf dataset end to end
+"""
+import pytest
+from django.db import connection
+
+from tracker.models import FutureUpdateCache, StackComponent
+from tracker.tests.test_fixtures import (
+    FUTURE_UPDATE_ROW_FIELDS,
+    build_perf_dataset,
+    bulk_create_future_updates,
+    count_rows,
+    no_indexes,
+)
+
+
+def _secondary_indexes(model):
+    """Names of the non-unique indexes on the model's table."""
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    return {
+        name for name, info in constraints.items()
+        if info['index'] and not info['unique'] and not info['primary_key']
+    }
+
+
+@pytest.mark.django_db
+class TestNoIndexes:
+    """Test that no_indexes drops secondary indexes and puts them back."""
+
+    def test_indexes_restored_on_exit(self):
+        before = _secondary_indexes(StackComponent)
+        assert before
+
+        with no_indexes(StackComponent):
+            assert not _secondary_indexes(StackComponent)
+
+        assert _secondary_indexes(StackComponent) == before
+
+    def test_indexes_restored_on_error(self):
+        before = _secondary_indexes(StackComponent)
+
+        with pytest.raises(RuntimeError):
+            with no_indexes(StackComponent):
+                raise RuntimeError("load failed")
+
+        assert _secondary_indexes(StackComponent) == before
+
+
+@pytest.mark.django_db
+class TestBulkCreateFutureUpdates:
+    """Test that row tuples map onto FUTURE_UPDATE_ROW_FIELDS."""
+
+    def test_rows_become_future_updates(self):
+        row = ('polars', '2.0.0', 70, None, 'Streaming engine', 'https://pola.rs/roadmap', 'detected', False)
+        bulk_create_future_updates([row], batch_size=1)
+
+        future = FutureUpdateCache.objects.get(library='polars', version='2.0.0')
+        assert tuple(getattr(future, field) for field in FUTURE_UPDATE_ROW_FIELDS) == row
+
+
+@pytest.mark.django_db
+class TestPerfDataset:
+    """Test build_perf_dataset with a small n."""
+
+    def test_small_dataset(self):
+        components_before, futures_before = count_rows(StackComponent, FutureUpdateCache)
+
+        project = build_perf_dataset(n=5, batch_size=2)
+
+        assert project.components.count() == 5
+        assert count_rows(StackComponent, FutureUpdateCache) == (components_before + 5, futures_before + 5)
+        future = FutureUpdateCache.objects.get(library='perf-lib-4')
+        assert (future.version, future.confidence, future.status) == ('2.0.0', 85, 'detected')
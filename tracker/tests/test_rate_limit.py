@@ -0,0 +1,31 @@
+"""
+Tests for the TokenBucket rate limiter used by the Serper and Groq clients.
+"""
+import pytest
+
+from tracker.utils.rate_limit import TokenBucket
+
+
+class TestTokenBucket:
+    """Test capacity validation and burst handling."""
+
+    def test_burst_goes_through_immediately(self):
+        bucket = TokenBucket(rate=1, capacity=3)
+        for _ in range(3):
+            bucket.acquire()
+        assert bucket._tokens < 1
+
+    def test_capacity_below_one_token_is_rejected(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=0.5)
+
+    def test_acquire_more_than_capacity_is_rejected(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, capacity=2).acquire(3)
+
+    def test_env_burst_is_clamped_to_one(self, monkeypatch):
+        monkeypatch.setenv("TEST_QPS", "2")
+        monkeypatch.setenv("TEST_BURST", "0.2")
+        bucket = TokenBucket.from_env("TEST", default_rate=1, default_burst=5)
+        assert bucket.capacity == 1.0
+        bucket.acquire()
@@ -3,6 +3,8 @@ import requests
 from typing import Iterable
 from dotenv import load_dotenv
 
+from tracker.utils.csv_fields import split_csv
+
 load_dotenv()
 
 # Mailtrap Transactional/Bulk API endpoint
@@ -58,7 +60,7 @@ def send_confidence_update_email(
     
     # Normalize recipients
     if isinstance(recipients, str):
-        recipients = [r.strip() for r in recipients.split(",") if r.strip()]
+        recipients = split_csv(recipients)
     
     recipients = list(recipients or [])
     if not recipients:
@@ -0,0 +1,14 @@
+import re
+
+# Splits on commas and trims the surrounding whitespace in one pass
+_CSV_RE = re.compile(r"\s*,\s*")
+
+
+def split_csv(raw: str | None) -> list[str]:
+    """
+    Split a comma-separated field (emails, notification types, ...) into
+    its non-empty, whitespace-trimmed items.
+    """
+    if not raw:
+        return []
+    return [item for item in _CSV_RE.split(raw.strip()) if item]
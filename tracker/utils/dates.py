@@ -0,0 +1,39 @@
+from datetime import date, datetime
+
+# Release date layouts seen in Groq/Serper output, tried in order
+KNOWN_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%d-%m-%Y",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+    "%d %b %Y",
+    "%d %B %Y",
+)
+
+
+def parse_release_date(value) -> date | None:
+    """
+    Parse a release date in any of KNOWN_DATE_FORMATS or ISO 8601 (with an optional
+    time part); placeholders like "Q1 2025" or "Not Confirmed" become None.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+
+    text = str(value or "").strip()
+    if not text:
+        return None
+
+    for fmt in KNOWN_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
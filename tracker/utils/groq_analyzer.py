@@ -6,6 +6,8 @@ from dotenv import load_dotenv
 from packaging import version as pkg_version
 from pathlib import Path
 
+from tracker.utils.rate_limit import TokenBucket
+
 # ✅ Load environment early
 BASE_DIR = Path(__file__).resolve().parents[2]
 env_path = BASE_DIR / ".env"
@@ -122,7 +124,7 @@ def _extract_json(s: str) -> dict:
 
 # --- Core Analyzer Class ---
 class GroqAnalyzer:
-    def __init__(self):
+    def __init__(self, rate_limiter: TokenBucket | None = None):
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             raise RuntimeError("GROQ_API_KEY missing in .env")
@@ -131,6 +133,8 @@ class GroqAnalyzer:
         # ✅ Updated model list — choose safest available
         self.model = os.getenv("GROQ_MODEL")
         self._validate_model()
+        # Groq enforces requests-per-minute limits; cap sustained rate (GROQ_QPS / GROQ_BURST)
+        self.rate_limiter = rate_limiter or TokenBucket.from_env("GROQ", default_rate=0.5, default_burst=5)
 
     def _validate_model(self):
         """Fallback if model is deprecated or unavailable."""
@@ -173,6 +177,7 @@ class GroqAnalyzer:
         )
 
         try:
+            self.rate_limiter.acquire()
             comp = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
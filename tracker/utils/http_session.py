@@ -0,0 +1,30 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_http_session(pool_connections: int = 32, pool_maxsize: int = 32, retries: int = 3) -> requests.Session:
+    """
+    Build a requests.Session with a pooled HTTPS adapter.
+
+    Reusing one session keeps TCP/TLS connections alive between the many
+    Serper and Mailtrap calls made during a run. Retries only cover connection
+    errors and rate limiting/unavailable responses so a POST is never replayed
+    after the server accepted it.
+
+    Callers own the session and should close it when they are done.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=(429, 503),
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
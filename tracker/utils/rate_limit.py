@@ -0,0 +1,48 @@
+import os
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Simple thread-safe token-bucket rate limiter for synchronous callers.
+
+    `rate` tokens are added per second up to `capacity`, so short bursts go
+    through immediately and only the sustained rate is capped. A rate of 0
+    (or less) disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        if self.capacity < 1:
+            raise ValueError(f"TokenBucket capacity must be at least 1, got {self.capacity}")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, prefix: str, default_rate: float, default_burst: float) -> "TokenBucket":
+        """Build a limiter from <PREFIX>_QPS and <PREFIX>_BURST environment variables."""
+        rate = float(os.getenv(f"{prefix}_QPS", default_rate))
+        # A burst below one token could never satisfy a single acquire()
+        burst = max(1.0, float(os.getenv(f"{prefix}_BURST", default_burst)))
+        return cls(rate, capacity=burst)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until `tokens` are available, then consume them."""
+        if self.rate <= 0:
+            return
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of capacity {self.capacity}")
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            # Sleep without the lock so other threads can refill and take tokens meanwhile
+            time.sleep(wait)
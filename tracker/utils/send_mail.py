@@ -1,70 +1,168 @@
 import os
+import re
 import requests
+from functools import lru_cache
+from html import escape as _escape
 from typing import Iterable
 from dotenv import load_dotenv
 
+from tracker.utils.csv_fields import split_csv
+
 load_dotenv()
 
 # Mailtrap Transactional/Bulk API endpoint
 MAILTRAP_BASE = "https://bulk.api.mailtrap.io/api/send"
+# Batch endpoint: one POST carries many messages sharing a base payload
+MAILTRAP_BATCH = "https://bulk.api.mailtrap.io/api/batch"
+# Mailtrap accepts at most this many messages per batch request
+MAILTRAP_BATCH_LIMIT = 500
 
+# Sender shown on every notification
+_SENDER = {"email": "hello@demomailtrap.co", "name": "LibTrack AI"}
 
-def send_update_email(
-    mailtrap_api_key: str | None,
+# Table row templates; the confidence cell is only present when some update carries one
+_ROW_TMPL_NO_CONF = """
+                <tr>
+                    <td style="padding:8px;border:1px solid #dfe3e7;">%s</td>
+                    <td style="padding:8px;border:1px solid #dfe3e7;">%s</td>
+                    <td style="padding:8px;border:1px solid #dfe3e7;">%s</td>
+                    <td style="padding:8px;border:1px solid #dfe3e7;">%s</td>
+                    <td style="padding:8px;border:1px solid #dfe3e7;">%s</td>
+                    %.0s
+                </tr>
+        """
+_ROW_TMPL_WITH_CONF = _ROW_TMPL_NO_CONF.replace(
+    "%.0s", '<td style="padding:8px;border:1px solid #dfe3e7;"><strong>%s%%</strong></td>'
+)
+
+_CONF_TH = '<th style="padding:8px;border:1px solid #dfe3e7;">Confidence</th>'
+
+# Outer email document; only the per-call fragments are substituted in
+_EMAIL_SKELETON = """
+    <div style="font-family:Inter,system-ui,-apple-system,sans-serif;font-size:14px;color:#111;line-height:1.5">
+        <p style="margin:0 0 16px;">Hello Team,</p>
+        <p style="margin:0 0 16px;">
+            LibTrack AI detected $update_word update activity 
+            impacting the <strong>$project_name</strong> project.
+            Please review the details below and plan follow-up actions as needed.
+        </p>
+        <table style="width:100%;border-collapse:collapse;font-size:13px;margin:0 0 16px;">
+            <thead>
+                <tr style="background:#f0f4f8;text-align:left;">
+                    <th style="padding:8px;border:1px solid #dfe3e7;">Library</th>
+                    <th style="padding:8px;border:1px solid #dfe3e7;">Type</th>
+                    <th style="padding:8px;border:1px solid #dfe3e7;">Version</th>
+                    <th style="padding:8px;border:1px solid #dfe3e7;">Category</th>
+                    <th style="padding:8px;border:1px solid #dfe3e7;">Release Date</th>
+                    $confidence_header
+                </tr>
+            </thead>
+            <tbody>
+                $table_rows
+            </tbody>
+        </table>
+        <p style="margin:0 0 12px;"><strong>Release Summary</strong></p>
+        $summary_blocks
+        $future_notice
+        <p style="margin:16px 0;">
+            Kindly schedule upgrades or mitigations as appropriate. as this is automated notification. Do not reply to this message.
+        </p>
+        <p style="margin:0;">Best regards,<br/><strong>LibTrack AI</strong></p>
+        <hr style="margin:24px 0;border:none;border-top:1px solid #e5e7eb;"/>
+        <p style="color:#666;font-size:12px;margin:0;">Automated notification powered by LibTrack AI.</p>
+    </div>
+    """
+
+# Split once into literal/name pairs: even slots are literal HTML, odd slots name a field
+_SKELETON_PARTS = tuple(re.split(r"\$(\w+)", _EMAIL_SKELETON))
+
+
+def _render_skeleton(**fields: str) -> str:
+    """Interleave the pre-split skeleton literals with the given field values."""
+    parts = list(_SKELETON_PARTS)
+    parts[1::2] = [fields[name] for name in _SKELETON_PARTS[1::2]]
+    return "".join(parts)
+
+
+# Display labels for the known component types; anything else falls back to str.title()
+COMPONENT_TYPE_LABEL = {"library": "Library", "language": "Language", "tool": "Tool"}
+
+
+# The only update fields the renderer reads; the cache key is built from these alone
+_RENDERED_FIELDS = (
+    "library", "component_type", "version", "category_label", "category",
+    "release_date", "confidence", "source", "summary",
+)
+
+
+def _render_entry(has_confidence: bool, entry: dict) -> tuple[str, str]:
+    """Render one update's table row and summary block, from the shared cache when possible."""
+    key = tuple((field, entry[field]) for field in _RENDERED_FIELDS if field in entry)
+    try:
+        hash(key)
+    except TypeError:
+        # A rendered field holds an unhashable value; render it without caching
+        return _render_entry_html(has_confidence, entry)
+    return _render_entry_cached(has_confidence, key)
+
+
+@lru_cache(maxsize=512)
+def _render_entry_cached(has_confidence: bool, items: tuple) -> tuple[str, str]:
+    """Memoized _render_entry_html keyed on the rendered (field, value) pairs."""
+    return _render_entry_html(has_confidence, dict(items))
+
+
+def _render_entry_html(has_confidence: bool, entry: dict) -> tuple[str, str]:
+    """Render one update's table row and summary block."""
+    # Entries carry LLM/web supplied text, so every field is escaped before interpolation
+    escape = _escape
+
+    # The confidence slot is simply dropped when no update in the email carries one
+    row_tmpl = _ROW_TMPL_WITH_CONF if has_confidence else _ROW_TMPL_NO_CONF
+    row_html = row_tmpl % (
+        escape(str(entry.get('library', 'Unknown'))),
+        escape(COMPONENT_TYPE_LABEL.get(entry.get('component_type', 'library')) or entry.get('component_type', 'library').title()),
+        escape(str(entry.get('version', 'n/a'))),
+        escape(str(entry.get('category_label') or entry.get('category', 'n/a'))),
+        escape(str(entry.get('release_date', 'Unknown'))),
+        escape(str(entry.get("confidence", "N/A"))),
+    )
+
+    entry_source = entry.get("source") or ""
+    link_html = (
+        f"<a href='{escape(entry_source)}' target='_blank' rel='noopener'>Read release notes</a>"
+        if entry_source
+        else "<span style='color:#999'>Source link not provided.</span>"
+    )
+    summary_html = f"""
+            <div style="margin:0 0 16px;">
+                <p style="margin:0 0 6px;"><strong>{escape(str(entry.get('library', 'Unknown')))} {escape(str(entry.get('version', '')))}</strong></p>
+                <p style="margin:0 0 6px;">{escape(str(entry.get('summary', 'No summary provided.')))}</p>
+                {link_html}
+            </div>
+            """
+    return row_html, summary_html
+
+
+def compose_update_email(
     project_name: str,
-    recipients: Iterable[str] | str,
     library: str,
     version: str,
     category: str,
     summary: str | None,
     source: str,
-    release_date: str | None = None,
-    from_email: str | None = None,
-    timeout: int = 15,
-    updates: list[dict[str, str]] | None = None,
-    future_opt_in: bool = False,
-) -> tuple[bool, str]:
+    release_date: str | None,
+    updates: list[dict[str, str]] | None,
+    future_opt_in: bool,
+) -> tuple[str, str, str]:
     """
-    Send an HTML email via Mailtrap's Bulk (Transactional) API.
-
-    Args:
-        mailtrap_api_key: Mailtrap API key (if None, uses MAILTRAP_API_KEY from .env)
-        project_name: Name of the project
-        recipients: Iterable of emails or comma-separated string of emails
-        library: Library name (e.g., 'numpy')
-        version: Version string (e.g., '2.2.3')
-        category: 'major', 'minor', or 'mix'
-        summary: Short release summary text
-        source: URL to official release notes
-        release_date: Release date string used when no update list is provided
-        from_email: Sender email (if None, uses MAILTRAP_FROM_EMAIL from .env)
-        timeout: HTTP request timeout in seconds
-        updates: Optional list of per-library update dicts for tabular formatting
-        future_opt_in: True when registration enabled future update notifications
-
-    Returns:
-        (success: bool, status_text: str)
+    Render one notification; returns (subject, html_content, Mailtrap category).
+    send_update_email, send_update_email_batch and the test_email preview all render through this.
     """
+    is_future = future_opt_in or category == "future"
 
-    api_key = mailtrap_api_key or os.getenv("MAILTRAP_API_KEY")
-    from_addr = from_email or os.getenv("MAILTRAP_FROM_EMAIL")
-
-    if not api_key or not from_addr:
-        return (
-            False,
-            "❌ Missing MAILTRAP_API_KEY or MAILTRAP_FROM_EMAIL in .env",
-        )
-
-    # Normalize recipients (support both list and comma-separated string)
-    if isinstance(recipients, str):
-        recipients = [r.strip() for r in recipients.split(",") if r.strip()]
-
-    recipients = list(recipients or [])
-    if not recipients:
-        return False, "❌ No valid recipients provided"
-    
     # ===== NEW: Different subject for future updates =====
-    if category == "future" or future_opt_in:
+    if is_future:
         subject = f"🔮 Future Update Alert: {library} {version} Planned"
     else:
         subject = f"{library} {version} Released"
@@ -85,46 +183,25 @@ def send_update_email(
     # ===== NEW: Check if we have any future updates with confidence =====
     has_confidence = any("confidence" in u for u in updates_payload)
     
-    table_rows_html = "".join(
-        f"""
-                <tr>
-                    <td style="padding:8px;border:1px solid #dfe3e7;">{entry.get('library', 'Unknown')}</td>
-                    <td style="padding:8px;border:1px solid #dfe3e7;">{entry.get('component_type', 'library').title()}</td>
-                    <td style="padding:8px;border:1px solid #dfe3e7;">{entry.get('version', 'n/a')}</td>
-                    <td style="padding:8px;border:1px solid #dfe3e7;">{entry.get('category_label') or entry.get('category', 'n/a')}</td>
-                    <td style="padding:8px;border:1px solid #dfe3e7;">{entry.get('release_date', 'Unknown')}</td>
-                    {f'<td style="padding:8px;border:1px solid #dfe3e7;"><strong>{entry.get("confidence", "N/A")}%</strong></td>' if has_confidence else ''}
-                </tr>
-        """
-        for entry in updates_payload
-    )
-
-
-    summary_sections: list[str] = []
+    # Single pass: table row, summary block and confidence for each entry.
+    # The same release usually goes out to many projects, so each entry's HTML comes from a shared cache
+    rows = []
+    summary_sections = []
+    confidences = []
     for entry in updates_payload:
-        entry_source = entry.get("source") or ""
-        link_html = (
-            f"<a href='{entry_source}' target='_blank' rel='noopener'>Read release notes</a>"
-            if entry_source
-            else "<span style='color:#999'>Source link not provided.</span>"
-        )
-        summary_sections.append(
-            f"""
-            <div style="margin:0 0 16px;">
-                <p style="margin:0 0 6px;"><strong>{entry.get('library', 'Unknown')} {entry.get('version', '')}</strong></p>
-                <p style="margin:0 0 6px;">{entry.get('summary', 'No summary provided.')}</p>
-                {link_html}
-            </div>
-            """
-        )
+        row_html, summary_html = _render_entry(has_confidence, entry)
+        rows.append(row_html)
+        summary_sections.append(summary_html)
+        if "confidence" in entry:
+            confidences.append(entry["confidence"])
 
+    table_rows_html = "".join(rows)
     summary_blocks = "".join(summary_sections) or "<p>No summary details were provided for these releases.</p>"
     
     # ===== ENHANCED: Better future update disclaimer =====
     future_notice_html = ""
-    if future_opt_in or category == "future":
-        # Calculate average confidence if available
-        confidences = [u.get("confidence", 0) for u in updates_payload if "confidence" in u]
+    if is_future:
+        # Average confidence of the entries collected above, if any
         avg_confidence = sum(confidences) // len(confidences) if confidences else 0
         
         confidence_text = ""
@@ -142,40 +219,80 @@ def send_update_email(
         </div>
         """
 
-    html_content = f"""
-    <div style="font-family:Inter,system-ui,-apple-system,sans-serif;font-size:14px;color:#111;line-height:1.5">
-        <p style="margin:0 0 16px;">Hello Team,</p>
-        <p style="margin:0 0 16px;">
-            LibTrack AI detected {'upcoming planned' if future_opt_in or category == 'future' else 'recent'} update activity 
-            impacting the <strong>{project_name}</strong> project.
-            Please review the details below and plan follow-up actions as needed.
-        </p>
-        <table style="width:100%;border-collapse:collapse;font-size:13px;margin:0 0 16px;">
-            <thead>
-                <tr style="background:#f0f4f8;text-align:left;">
-                    <th style="padding:8px;border:1px solid #dfe3e7;">Library</th>
-                    <th style="padding:8px;border:1px solid #dfe3e7;">Type</th>
-                    <th style="padding:8px;border:1px solid #dfe3e7;">Version</th>
-                    <th style="padding:8px;border:1px solid #dfe3e7;">Category</th>
-                    <th style="padding:8px;border:1px solid #dfe3e7;">Release Date</th>
-                    {f'<th style="padding:8px;border:1px solid #dfe3e7;">Confidence</th>' if has_confidence else ''}
-                </tr>
-            </thead>
-            <tbody>
-                {table_rows_html}
-            </tbody>
-        </table>
-        <p style="margin:0 0 12px;"><strong>Release Summary</strong></p>
-        {summary_blocks}
-        {future_notice_html}
-        <p style="margin:16px 0;">
-            Kindly schedule upgrades or mitigations as appropriate. as this is automated notification. Do not reply to this message.
-        </p>
-        <p style="margin:0;">Best regards,<br/><strong>LibTrack AI</strong></p>
-        <hr style="margin:24px 0;border:none;border-top:1px solid #e5e7eb;"/>
-        <p style="color:#666;font-size:12px;margin:0;">Automated notification powered by LibTrack AI.</p>
-    </div>
+    html_content = _render_skeleton(
+        update_word="upcoming planned" if is_future else "recent",
+        project_name=_escape(project_name),
+        confidence_header=_CONF_TH if has_confidence else "",
+        table_rows=table_rows_html,
+        summary_blocks=summary_blocks,
+        future_notice=future_notice_html,
+    )
+
+    payload_category = "Future Updates" if future_opt_in else "Library Updates"
+    return subject, html_content, payload_category
+
+
+def send_update_email(
+    mailtrap_api_key: str | None,
+    project_name: str,
+    recipients: Iterable[str] | str,
+    library: str,
+    version: str,
+    category: str,
+    summary: str | None,
+    source: str,
+    release_date: str | None = None,
+    from_email: str | None = None,
+    timeout: int = 15,
+    updates: list[dict[str, str]] | None = None,
+    future_opt_in: bool = False,
+    session: requests.Session | None = None,
+    test_mode: bool | None = None,
+) -> tuple[bool, str]:
     """
+    Send an HTML email via Mailtrap's Bulk (Transactional) API.
+
+    Args:
+        mailtrap_api_key: Mailtrap API key (if None, uses MAILTRAP_API_KEY from .env)
+        project_name: Name of the project
+        recipients: Iterable of emails or comma-separated string of emails
+        library: Library name (e.g., 'numpy')
+        version: Version string (e.g., '2.2.3')
+        category: 'major', 'minor', or 'mix'
+        summary: Short release summary text
+        source: URL to official release notes
+        release_date: Release date string used when no update list is provided
+        from_email: Sender email (if None, uses MAILTRAP_FROM_EMAIL from .env)
+        timeout: HTTP request timeout in seconds
+        updates: Optional list of per-library update dicts for tabular formatting
+        future_opt_in: True when registration enabled future update notifications
+        session: Optional shared requests.Session to reuse pooled connections
+        test_mode: Print instead of sending; if None, read TEST_MODE from the environment (on unless "false")
+
+    Returns:
+        (success: bool, status_text: str)
+    """
+
+    api_key = mailtrap_api_key or os.getenv("MAILTRAP_API_KEY")
+    from_addr = from_email or os.getenv("MAILTRAP_FROM_EMAIL")
+
+    if not api_key or not from_addr:
+        return (
+            False,
+            "❌ Missing MAILTRAP_API_KEY or MAILTRAP_FROM_EMAIL in .env",
+        )
+
+    # Normalize recipients (support both list and comma-separated string)
+    if isinstance(recipients, str):
+        recipients = split_csv(recipients)
+
+    recipients = list(recipients or [])
+    if not recipients:
+        return False, "❌ No valid recipients provided"
+    
+    subject, html_content, payload_category = compose_update_email(
+        project_name, library, version, category, summary, source, release_date, updates, future_opt_in
+    )
 
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -183,33 +300,133 @@ def send_update_email(
     }
 
     # Mailtrap Bulk API payload
-    payload_category = "Future Updates" if future_opt_in else "Library Updates"
     payload = {
-        "from": {"email": "hello@demomailtrap.co", "name": "LibTrack AI"},
+        "from": _SENDER,
         "to": [{"email": r} for r in recipients],
         "subject": subject,
         "html": html_content,
         "category": payload_category,
     }
 
-    # get global TEST_MODE from settings
-    TEST_MODE = os.getenv("TEST_MODE", True)
-    if TEST_MODE:
+    if test_mode is None:
+        test_mode = os.getenv("TEST_MODE", "True").strip().lower() not in ("false", "0", "no")
+    if test_mode:
         print("TEST_MODE: Email subject:", subject)
         print("TEST_MODE: Email content:", html_content)
         return True, "🧪🧪 Email would be sent in TEST_MODE 🧪🧪"
 
-    # try:
-    #     resp = requests.post(MAILTRAP_BASE, headers=headers, json=payload, timeout=15)
-    #     ok = 200 <= resp.status_code < 300
-    #     status_text = f"Mailtrap: {resp.status_code} - {resp.text}"
-    #     if ok:
-    #         print(f"✅ Email sent successfully: {status_text}")
-    #     else:
-    #         print(f"❌ Email failed to send: {status_text}")
-    #     return ok, status_text
-    # except Exception as e:
-    #     return False, f"Mailtrap exception: {e}"
+    http = session or requests
+    try:
+        resp = http.post(MAILTRAP_BASE, headers=headers, json=payload, timeout=timeout)
+        ok = 200 <= resp.status_code < 300
+        status_text = f"Mailtrap: {resp.status_code} - {resp.text}"
+        if ok:
+            print(f"✅ Email sent successfully: {status_text}")
+        else:
+            print(f"❌ Email failed to send: {status_text}")
+        return ok, status_text
+    except Exception as e:
+        return False, f"Mailtrap exception: {e}"
+
+
+def send_update_email_batch(
+    mailtrap_api_key: str | None,
+    messages: list[dict],
+    from_email: str | None = None,
+    timeout: int = 15,
+    session: requests.Session | None = None,
+    test_mode: bool | None = None,
+) -> tuple[bool, str]:
+    """
+    Send many notifications through Mailtrap's Batch API, up to MAILTRAP_BATCH_LIMIT per request.
+
+    Args:
+        mailtrap_api_key: Mailtrap API key (if None, uses MAILTRAP_API_KEY from .env)
+        messages: One dict per email with send_update_email's content arguments
+            (project_name, recipients, library, version, category, summary, source,
+            and optionally release_date, updates, future_opt_in)
+        from_email: Sender email (if None, uses MAILTRAP_FROM_EMAIL from .env)
+        timeout: HTTP request timeout in seconds
+        session: Optional shared requests.Session to reuse pooled connections
+        test_mode: Print instead of sending; if None, read TEST_MODE from the environment (on unless "false")
+
+    Returns:
+        (success: bool, status_text: str) — success only if every batch request was accepted
+    """
+
+    api_key = mailtrap_api_key or os.getenv("MAILTRAP_API_KEY")
+    from_addr = from_email or os.getenv("MAILTRAP_FROM_EMAIL")
+
+    if not api_key or not from_addr:
+        return (
+            False,
+            "❌ Missing MAILTRAP_API_KEY or MAILTRAP_FROM_EMAIL in .env",
+        )
+
+    requests_payload = []
+    for message in messages:
+        recipients = message["recipients"]
+        if isinstance(recipients, str):
+            recipients = split_csv(recipients)
+        recipients = list(recipients or [])
+        if not recipients:
+            continue
+        subject, html_content, payload_category = compose_update_email(
+            message["project_name"],
+            message["library"],
+            message["version"],
+            message["category"],
+            message.get("summary"),
+            message["source"],
+            message.get("release_date"),
+            message.get("updates"),
+            message.get("future_opt_in", False),
+        )
+        requests_payload.append({
+            "to": [{"email": r} for r in recipients],
+            "subject": subject,
+            "html": html_content,
+            "category": payload_category,
+        })
+
+    if not requests_payload:
+        return False, "❌ No valid recipients provided"
+
+    if test_mode is None:
+        test_mode = os.getenv("TEST_MODE", "True").strip().lower() not in ("false", "0", "no")
+    if test_mode:
+        for entry in requests_payload:
+            print("TEST_MODE: Email subject:", entry["subject"])
+        return True, f"🧪🧪 {len(requests_payload)} emails would be sent in TEST_MODE 🧪🧪"
+
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+    http = session or requests
+    ok = True
+    statuses = []
+    for start in range(0, len(requests_payload), MAILTRAP_BATCH_LIMIT):
+        payload = {
+            "base": {"from": _SENDER},
+            "requests": requests_payload[start:start + MAILTRAP_BATCH_LIMIT],
+        }
+        try:
+            resp = http.post(MAILTRAP_BATCH, headers=headers, json=payload, timeout=timeout)
+        except Exception as e:
+            ok = False
+            statuses.append(f"Mailtrap exception: {e}")
+            continue
+        ok = ok and 200 <= resp.status_code < 300
+        statuses.append(f"Mailtrap: {resp.status_code} - {resp.text}")
+
+    status_text = "; ".join(statuses)
+    if ok:
+        print(f"✅ Batch of {len(requests_payload)} emails sent successfully: {status_text}")
+    else:
+        print(f"❌ Batch email failed to send: {status_text}")
+    return ok, status_text
 
 
 # from tracker.utils.send_mail import send_update_email  # adjust import path if different
@@ -7,6 +7,8 @@ from dotenv import load_dotenv
 from pathlib import Path
 from datetime import datetime
 
+from tracker.utils.rate_limit import TokenBucket
+
 # ✅ Locate .env manually (robust)
 BASE_DIR = Path(__file__).resolve().parents[2]
 env_path = BASE_DIR / ".env"
@@ -19,6 +21,9 @@ else:
 # ✅ Default Serper endpoint
 SERPER_URL = os.getenv("SERPER_SEARCH_URL", "https://google.serper.dev/search")
 
+# Serper accepts up to 100 queries in a single batched POST
+SERPER_BATCH_SIZE = 100
+
 # Host scoring to favor official sources when possible
 # Higher scores = higher priority
 _OFFICIAL_HOST_WEIGHTS = {
@@ -168,12 +173,22 @@ class SerperFetcher:
     information — by combining multiple search facets.
     """
 
-    def __init__(self, timeout: int = 15, debug: bool = False):
+    def __init__(
+        self,
+        timeout: int = 15,
+        debug: bool = False,
+        session: requests.Session | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ):
         self.api_key = os.getenv("SERPER_API_KEY")
         if not self.api_key:
             raise RuntimeError("SERPER_API_KEY missing in .env")
         self.timeout = timeout
         self.debug = debug
+        # Shared session keeps connections alive across calls; callers may pass their own pool
+        self.session = session if session is not None else requests.Session()
+        # Caps sustained request rate (SERPER_QPS / SERPER_BURST) while allowing bursts
+        self.rate_limiter = rate_limiter or TokenBucket.from_env("SERPER", default_rate=5, default_burst=10)
 
     # ---------------------------------------------
     def _call_serper(self, query: str) -> dict:
@@ -184,7 +199,8 @@ class SerperFetcher:
         }
         payload = {"q": query, "num": 10, "gl": "us"}
         try:
-            resp = requests.post(SERPER_URL, headers=headers, json=payload, timeout=self.timeout)
+            self.rate_limiter.acquire()
+            resp = self.session.post(SERPER_URL, headers=headers, json=payload, timeout=self.timeout)
             resp.raise_for_status()
             data = resp.json()
             data["query"] = query  # keep track of which prompt produced the data
@@ -199,6 +215,46 @@ class SerperFetcher:
         except Exception as e:
             return {"error": str(e), "results": []}
 
+    # ---------------------------------------------
+    def _call_serper_batch(self, queries: list[str]) -> list[dict]:
+        """
+        Call Serper once for several queries by posting a JSON array.
+        Returns one response dict per query, in the same order.
+        """
+        if not queries:
+            return []
+        headers = {
+            "X-API-KEY": self.api_key,
+            "Content-Type": "application/json",
+        }
+        responses: list[dict] = []
+        for start in range(0, len(queries), SERPER_BATCH_SIZE):
+            chunk = queries[start:start + SERPER_BATCH_SIZE]
+            payload = [{"q": q, "num": 10, "gl": "us"} for q in chunk]
+            resp = None
+            try:
+                self.rate_limiter.acquire()
+                resp = self.session.post(SERPER_URL, headers=headers, json=payload, timeout=self.timeout)
+                resp.raise_for_status()
+                data = resp.json()
+                if isinstance(data, dict):
+                    data = [data]
+                if len(data) != len(chunk):
+                    raise ValueError(f"expected {len(chunk)} results, got {len(data)}")
+                for query, item in zip(chunk, data):
+                    item["query"] = query  # keep track of which prompt produced the data
+                responses.extend(data)
+                if self.debug:
+                    print(f"✅ Serper batch success for {len(chunk)} queries")
+            except requests.HTTPError as e:
+                msg = f"HTTP {resp.status_code}: {resp.text}" if resp is not None else str(e)
+                if self.debug:
+                    print(f"❌ Serper batch error: {msg}")
+                responses.extend({"error": msg, "results": []} for _ in chunk)
+            except Exception as e:
+                responses.extend({"error": str(e), "results": []} for _ in chunk)
+        return responses
+
     # ---------------------------------------------
     def _merge_results(self, *responses: dict) -> dict:
         """Merge multiple Serper responses into a single coherent structure."""
@@ -211,6 +267,10 @@ class SerperFetcher:
                     merged["results"].extend(resp.get(k, []))
             merged["sources"].append({"query": resp.get("query", ""), "count": len(resp.get("organic", []))})
         merged["timestamp"] = datetime.utcnow().isoformat()
+        # Surface a failure only when no query produced anything usable
+        errors = [resp["error"] for resp in responses if isinstance(resp, dict) and resp.get("error")]
+        if errors and not merged["results"]:
+            merged["error"] = errors[0]
         return merged
 
     # ---------------------------------------------
@@ -347,38 +407,19 @@ class SerperFetcher:
         return three_months_ago.strftime("%Y-%m-%d")
 
     # ---------------------------------------------
-    def search_library(self, library: str, current_version: str | None = None, component_type: str = "library") -> dict:
+    def _build_queries(self, library: str, component_type: str = "library") -> tuple[bool, bool, list[str]]:
         """
-        Searches the web for the most recent info about a given library or language.
-        
-        Args:
-            library: Name of the library or language
-            current_version: Current version to compare against
-            component_type: "library" or "language" (auto-detected if not specified)
-        
+        Build the Serper queries for a component.
+
         Returns:
-            dict with search results, filtered results, and version candidates
+            (is_language, is_tool, queries) where queries holds the base
+            queries followed by the future-update queries.
         """
-
-        if not library or not isinstance(library, str):
-            return {"error": "Invalid library name", "results": []}
-
         # Auto-detect component type
         is_language = component_type == "language" or self._is_programming_language(library)
         is_tool = component_type == "tool" or self._is_tool_or_service(library)
-        
-        # Determine final category
-        if is_language:
-            category = "language"
-        elif is_tool:
-            category = "tool"
-        else:
-            category = "library"
-        
-        time_filter = self._get_time_filter()
 
-        if self.debug:
-            print(f"🔍 Fetching {category} data for '{library}' (current={current_version})...")
+        time_filter = self._get_time_filter()
 
         # Different query strategies based on category
         if is_language:
@@ -417,9 +458,19 @@ class SerperFetcher:
             f"{library} release candidate OR beta announcement after:{time_filter}",
         ]
 
-        responses = [self._call_serper(q) for q in base_queries]
-        future_responses = [self._call_serper(q) for q in future_queries]
-        merged = self._merge_results(*responses, *future_responses)
+        return is_language, is_tool, base_queries + future_queries
+
+    # ---------------------------------------------
+    def _summarize_results(
+        self,
+        library: str,
+        current_version: str | None,
+        responses: list[dict],
+        is_language: bool,
+        is_tool: bool,
+    ) -> dict:
+        """Merge, score and filter the raw Serper responses for one component."""
+        merged = self._merge_results(*responses)
 
         filtered = []
         future_updates = []
@@ -483,6 +534,73 @@ class SerperFetcher:
             print(f"✅ Filtered {len(filtered)} higher-version results for {library}{future_msg}")
 
         return merged
+
+    # ---------------------------------------------
+    def search_library(self, library: str, current_version: str | None = None, component_type: str = "library") -> dict:
+        """
+        Searches the web for the most recent info about a given library or language.
+        
+        Args:
+            library: Name of the library or language
+            current_version: Current version to compare against
+            component_type: "library" or "language" (auto-detected if not specified)
+        
+        Returns:
+            dict with search results, filtered results, and version candidates
+        """
+
+        if not library or not isinstance(library, str):
+            return {"error": "Invalid library name", "results": []}
+
+        is_language, is_tool, queries = self._build_queries(library, component_type)
+
+        if self.debug:
+            category = "language" if is_language else "tool" if is_tool else "library"
+            print(f"🔍 Fetching {category} data for '{library}' (current={current_version})...")
+
+        responses = self._call_serper_batch(queries)
+        return self._summarize_results(library, current_version, responses, is_language, is_tool)
+
+    # ---------------------------------------------
+    def search_libraries_batch(self, components: list[tuple[str, str | None, str]]) -> dict[str, dict]:
+        """
+        Search several components with as few Serper round-trips as possible.
+
+        Every query for every component is sent through `_call_serper_batch`,
+        so a whole project (or daily run) costs one POST per
+        SERPER_BATCH_SIZE queries instead of one POST per query.
+
+        Args:
+            components: List of (name, current_version, component_type) tuples
+
+        Returns:
+            dict mapping component name to the same structure `search_library` returns
+        """
+        plans = []
+        seen: set[str] = set()
+        all_queries: list[str] = []
+        for library, current_version, component_type in components:
+            if not library or not isinstance(library, str) or library in seen:
+                continue
+            seen.add(library)
+            is_language, is_tool, queries = self._build_queries(library, component_type)
+            plans.append((library, current_version, is_language, is_tool, len(all_queries), len(queries)))
+            all_queries.extend(queries)
+
+        if self.debug:
+            print(f"🔍 Fetching data for {len(plans)} components in one batch ({len(all_queries)} queries)...")
+
+        responses = self._call_serper_batch(all_queries)
+        results: dict[str, dict] = {}
+        for library, current_version, is_language, is_tool, offset, count in plans:
+            results[library] = self._summarize_results(
+                library,
+                current_version,
+                responses[offset:offset + count],
+                is_language,
+                is_tool,
+            )
+        return results
     
 # Manual test when running directly
 # if __name__ == "__main__":
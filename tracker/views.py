@@ -1,7 +1,7 @@
 import json
 import traceback
 from collections import defaultdict
-from datetime import datetime
+from datetime import date
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout, update_session_auth_hash
@@ -9,11 +9,19 @@ from django.contrib.auth.forms import PasswordChangeForm
 from django.contrib.auth.decorators import login_required
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
+from django.core.cache import cache as django_cache
 from django.core.paginator import Paginator
 from django.db import transaction
 
 from tracker.models import UpdateCache, Project, StackComponent
 from tracker.forms import LoginForm, RegistrationForm
+from tracker.utils.csv_fields import split_csv
+from tracker.utils.dates import parse_release_date
+from tracker.signals import (
+    REGISTRATIONS_CACHE_KEY,
+    REGISTRATIONS_CACHE_TIMEOUT,
+    bulk_create_components,
+)
 
 VALID_NOTIFICATION_TYPES = {"both", "major", "minor", "future"}
 NOTIFICATION_ORDER = ("major", "minor", "future")
@@ -39,7 +47,7 @@ def _validate_emails(csv: str):
     Validates a comma-separated string of emails.
     Returns a list of valid emails or None if any are invalid.
     """
-    emails = [e.strip() for e in csv.split(",") if e.strip()]
+    emails = split_csv(csv)
     for e in emails:
         try:
             validate_email(e)
@@ -101,55 +109,24 @@ def _build_registration_payload(request):
     if not components:
         return None, "Add at least one technology component to the stack."
 
-    languages = [c for c in components if c["key"] == "language"]
-    others = [c for c in components if c["key"] != "language"]
-
+    # Components are stored as StackComponent rows; the legacy CSV columns
+    # (language_used, libraries, ...) are no longer built here.
     payload = {
         "project_name": project_name,
         "developer_names": developer_names,
         "developer_emails": ", ".join(emails),
-        "language_used": ", ".join([c["name"] for c in languages]),
-        "language_version": ", ".join([c["version"] for c in languages]),
-        "libraries": ", ".join([c["name"] for c in others]),
-        "library_versions": ", ".join([c["version"] for c in others]),
         "notification_type": notification_type,
-        "tech_stack": json.dumps(components),
+        "stack_components": components,
     }
-    payload["stack_components"] = components
     return payload, None
 
 
-def _format_release_date(raw: str | None) -> str:
-    value = (raw or "").strip()
-    if not value:
-        return ""
-
-    known_formats = (
-        "%Y-%m-%d",
-        "%d-%m-%Y",
-        "%Y/%m/%d",
-        "%d/%m/%Y",
-        "%b %d, %Y",
-        "%B %d, %Y",
-        "%d %b %Y",
-        "%d %B %Y",
-    )
-
-    for fmt in known_formats:
-        try:
-            parsed = datetime.strptime(value, fmt)
-            return parsed.strftime(STANDARD_DATE_OUTPUT)
-        except ValueError:
-            continue
-
-    try:
-        normalized = value.replace("Z", "+00:00")
-        parsed = datetime.fromisoformat(normalized)
+def _format_release_date(raw: date | str | None) -> str:
+    parsed = parse_release_date(raw)
+    if parsed is not None:
         return parsed.strftime(STANDARD_DATE_OUTPUT)
-    except ValueError:
-        pass
-
-    return value
+    # Placeholders such as "Q1 2025" are shown as they were given
+    return (raw or "").strip()
 
 
 def _normalize_component_key(category: str, key: str | None) -> str:
@@ -211,7 +188,7 @@ def _save_project_from_payload(payload: dict, *, instance: Project | None = None
             instance.save()
             instance.components.all().delete()
 
-        StackComponent.objects.bulk_create(
+        bulk_create_components(
             [
                 StackComponent(
                     project=instance,
@@ -242,7 +219,8 @@ def _serialize_project(project: Project) -> dict:
     ]
 
     languages = [comp for comp in components if comp["key"] == "language"]
-    notification_list = [item.strip() for item in (project.notification_type or "").split(",") if item.strip()]
+    prefs = project.notification_prefs
+    notification_list = [kind for kind in NOTIFICATION_ORDER if kind in prefs]
     if not notification_list:
         notification_list = ["major", "minor"]
 
@@ -260,6 +238,23 @@ def _serialize_project(project: Project) -> dict:
     }
 
 
+def _load_registrations() -> list[dict]:
+    project_qs = Project.objects.prefetch_related("components").order_by("-created_at")
+    return [_serialize_project(project) for project in project_qs]
+
+
+def _get_registrations() -> list[dict]:
+    """
+    Serialized registrations, cached for REGISTRATIONS_CACHE_TIMEOUT seconds.
+    Project/StackComponent signals drop the cache on every write.
+    """
+    return django_cache.get_or_set(
+        REGISTRATIONS_CACHE_KEY,
+        _load_registrations,
+        timeout=REGISTRATIONS_CACHE_TIMEOUT,
+    )
+
+
 def login_view(request):
     """
     Handles user login.
@@ -411,8 +406,7 @@ def dashboard(request):
         messages.error(request, "Unknown action.")
         return redirect("dashboard")
 
-    project_qs = Project.objects.prefetch_related("components").order_by("-created_at")
-    regs = [_serialize_project(project) for project in project_qs]
+    regs = _get_registrations()
 
     cache = UpdateCache.objects.order_by("-updated_at").all()
     
@@ -467,7 +461,8 @@ def updateHistory(request):
         project_lookup = {lib: sorted(list(names), key=str.casefold) for lib, names in map_temp.items()}
         project_names = sorted(projects_set, key=str.casefold)
 
-    cache_qs = UpdateCache.objects.order_by("-updated_at").all()
+    # The history table never shows the (potentially long) summary text
+    cache_qs = UpdateCache.objects.defer("summary").order_by("-updated_at")
     cache = list(cache_qs)
     for entry in cache:
         lib_key = (entry.library or "").strip().lower()